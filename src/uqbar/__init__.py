@@ -19,12 +19,21 @@ Metadata
 # --------------------------------------------------------------------------------------
 from __future__ import annotations
 
-from uqbar._version import version
 
 # --------------------------------------------------------------------------------------
-# Constants
+# Helpers
 # --------------------------------------------------------------------------------------
-__version__: str = version()
+def __getattr__(name: str) -> str:
+    # PEP 562: resolve `uqbar.__version__` lazily so importing the package
+    # does not pay for the VERSION file read; only `--version` (and the rare
+    # introspective caller) triggers it.
+    if name == "__version__":
+        from uqbar._version import version
+
+        value = version()
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # --------------------------------------------------------------------------------------
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: MIT
+# uqbar/_cliparse.py
+"""
+Uqbar MultiTool | CLI Parser Machinery
+======================================
+
+Overview
+--------
+argparse subclasses used by `uqbar.cli`. Kept in their own module so that
+`uqbar.cli` itself never imports argparse: the dispatcher, the hand-rolled
+fast paths and the unknown-tool branch all run without paying for it, and
+the `*_parser` functions pull this module in lazily only when a full parse
+is actually needed.
+
+Metadata
+--------
+- Project: Uqbar
+- License: MIT
+"""
+
+# --------------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import argparse
+from argparse import RawDescriptionHelpFormatter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+
+# --------------------------------------------------------------------------------------
+# Classes
+# --------------------------------------------------------------------------------------
+class _LazyVersionAction(argparse.Action):
+    """
+    `--version` action that defers reading the version file to trigger time,
+    instead of materializing the version string at parser construction.
+    """
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: str = argparse.SUPPRESS,
+        help: str | None = None,  # noqa: A002 - argparse API name
+    ) -> None:
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        from uqbar.cli import _get_version
+
+        print(f"{parser.prog} {_get_version()}")
+        parser.exit()
+
+
+class _LazyDocParser(argparse.ArgumentParser):
+    """
+    ArgumentParser that defers description/epilog construction until help is
+    actually rendered.
+
+    The multi-line f-string docs passed by the `*_parser` functions are only
+    ever read when `--help` fires, so building them on every invocation is
+    wasted work. Pass `desc_fn`/`epi_fn` zero-argument callables instead of
+    the materialized strings.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        desc_fn: Callable[[], str] | None = None,
+        epi_fn: Callable[[], str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._desc_fn = desc_fn
+        self._epi_fn = epi_fn
+        super().__init__(*args, **kwargs)
+
+    def format_help(self) -> str:
+        if self.description is None and self._desc_fn is not None:
+            self.description = self._desc_fn()
+        if self.epilog is None and self._epi_fn is not None:
+            self.epilog = self._epi_fn()
+        return super().format_help()
+
+
+# --------------------------------------------------------------------------------------
+# Exports
+# --------------------------------------------------------------------------------------
+__all__: list[str] = [
+    "_LazyVersionAction",
+    "_LazyDocParser",
+    "RawDescriptionHelpFormatter",
+]
@@ -94,7 +94,10 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
 
 from uqbar.acta.mood_predictor import predict_mood
 from uqbar.acta.trend_download_scraper import get_trends
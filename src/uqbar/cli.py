@@ -19,61 +19,133 @@ Metadata
 # --------------------------------------------------------------------------------------
 from __future__ import annotations
 
-import argparse
 import datetime as dt
+import functools
+import importlib
 import re
 import sys
-from collections.abc import Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Final
+from typing import TYPE_CHECKING
 
-from uqbar._version import version
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Callable, Sequence
+    from typing import Any, Final
 
 # --------------------------------------------------------------------------------------
 # Constants
 # --------------------------------------------------------------------------------------
-__version__: str = version()
-
-CURRENT_WORKING_DIR: Path = Path.cwd()
-
-
 # Main container
-UQBAR: str = "uqbar" # Main container name | Homes all tools
+UQBAR: str = sys.intern("uqbar") # Main container name | Homes all tools
 
 # Automation for social media
-ACTA: str = "acta"  # Program to generate youtube videos automatically
+ACTA: str = sys.intern("acta")  # Program to generate youtube videos automatically
 
 # Fetch/Send through Network/Web
-MILOU: str = "milou"  # Program to mass download youtube vidos, book pdfs, etc
+MILOU: str = sys.intern("milou")  # Program to mass download youtube vidos, book pdfs, etc
 
 # Music programming
-QUINCAS: str = "quincas"  # Program to produce music effortlesly without DAWs
+QUINCAS: str = sys.intern("quincas")  # Program to produce music effortlesly without DAWs
 
 # Search of any nature
-FAUST: str = "faust"  # Program to search for strings in dirs, files and inside
+FAUST: str = sys.intern("faust")  # Program to search for strings in dirs, files and inside
 
 # Prompt generator
-TIETA: str = "tieta"  # Program to generate claude prompts for summary-expansion
+TIETA: str = sys.intern("tieta")  # Program to generate claude prompts for summary-expansion
 
 # Datetime/Calendar-related tasks
-LOLA: str = "lola" # Program to perform datetime-related tasks
+LOLA: str = sys.intern("lola") # Program to perform datetime-related tasks
 
 # Cookiecutter
-DEFAULT: str = "default"  # Program to search for strings in dirs, files and inside
+DEFAULT: str = sys.intern("default")  # Program to search for strings in dirs, files and inside
+
+
+TRUE_VALUE_SET: frozenset[str] = frozenset({"true", "t", "yes", "y", "1", "on"})
 
+FALSE_VALUE_SET: frozenset[str] = frozenset({"false", "f", "no", "n", "0", "off"})
 
-TRUE_VALUE_SET: set[str] = {"true", "t", "yes", "y", "1", "on"}
+MISSING_VALUE_SET: frozenset[str] = frozenset(
+    {"none", "null", "nul", "nan", "na", "n/a", "void"}
+)
 
-FALSE_VALUE_SET: set[str] = {"false", "f", "no", "n", "0", "off"}
+# Sentinel distinguishing "token maps to None" from "token unknown" so
+# _parse_bool resolves with a single .get probe.
+_SENTINEL: object = object()
 
-MISSING_VALUE_SET: set[str] = {"none", "null", "nul", "nan", "na", "n/a", "void"}
+# Combined lookup for _parse_bool: one probe instead of up to three set
+# membership tests. The individual sets above are kept for the help text.
+_BOOL_VALUE_MAP: dict[str, bool | None] = (
+    {v: True for v in TRUE_VALUE_SET}
+    | {v: False for v in FALSE_VALUE_SET}
+    | {v: None for v in MISSING_VALUE_SET}
+)
+
+# Error text for _parse_bool, sorted and joined once at import instead of
+# per failure; only the offending value is interpolated at raise time.
+_BOOL_ERR_TEMPLATE: Final[str] = (
+    "Invalid boolean value: {!r}. Use one of: \n"
+    f"  - True Values: {', '.join(sorted(TRUE_VALUE_SET))}\n"
+    f"  - False Values: {', '.join(sorted(FALSE_VALUE_SET))}\n"
+    f"  - NA Values: {', '.join(sorted(MISSING_VALUE_SET))}\n"
+)
 
 
 SPLIT_PATTERN = r"[ ,;|\t\n]+"
 
+
+# Shared help-text boilerplate for the "reference CLI" tools. Kept as
+# `.format`-ready templates so each parser substitutes only its prog name
+# instead of rebuilding the whole string with an f-string.
+_REFERENCE_DESC_TEMPLATE: Final[str] = (
+    "{prog} - a reference CLI demonstrating clean argparse patterns.\n\n"
+    "It includes mandatory positional inputs (int/float/bool/str/path) and optional\n"
+    "flags with both short and long forms. Copy/paste and tailor as needed."
+)
+
+_REFERENCE_EPI_TEMPLATE: Final[str] = (
+    "Examples:\n"
+    f"  $ {UQBAR} {{prog}} 3 0.25 true 'hello' ./data\n"
+    f"  $ {UQBAR} {{prog}} 3 0.25 false 'hello' ./data --the-int 7 --the-path ~/Downloads\n"
+    f"  $ {UQBAR} {{prog}} 3 0.25 yes 'hello' ./data -e --the-boolean off\n"
+)
+
 # -------------------------------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------------------------------
+_VERSION_CACHE: str | None = None
+
+
+def _get_version() -> str:
+    """
+    Lazily read and cache the package version.
+
+    Only the `--version` flag ever needs it, so ordinary invocations skip
+    the version-file read entirely.
+    """
+    global _VERSION_CACHE
+    if _VERSION_CACHE is None:
+        from uqbar._version import version
+        _VERSION_CACHE = version()
+    return _VERSION_CACHE
+
+
+def __getattr__(name: str) -> str:
+    # PEP 562: keep `uqbar.cli.__version__` working without paying the
+    # version-file read on ordinary imports.
+    if name == "__version__":
+        return _get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _wants_help(argv: Sequence[str]) -> bool:
+    """
+    True when argv requests help. Parsers skip registering the help action
+    (and its formatter machinery) on ordinary invocations.
+    """
+    return any(a in ("-h", "--help") for a in argv)
+
+
 def _parse_bool(value: str) -> bool | None:
     """
     Robust boolean parser for CLI strings.
@@ -83,19 +155,69 @@ def _parse_bool(value: str) -> bool | None:
 
     Raises argparse.ArgumentTypeError on invalid values.
     """
-    v = value.strip().lower()
-    if v in TRUE_VALUE_SET:
-        return True
-    if v in FALSE_VALUE_SET:
-        return False
-    if v in MISSING_VALUE_SET:
+    result = _BOOL_VALUE_MAP.get(value.strip().lower(), _SENTINEL)
+    if result is not _SENTINEL:
+        return result
+    import argparse  # deferred: only the error path needs it
+    raise argparse.ArgumentTypeError(_BOOL_ERR_TEMPLATE.format(value))
+
+
+def _fast_parse_simple(argv: Sequence[str]) -> dict[str, Any] | None:
+    """
+    Hand-rolled parser for the simple tool surface shared by `quincas` and
+    `default`: one positional int plus `--the-boolean` and `--the-path`.
+
+    Skips argparse's parser construction entirely on the hot path; returns
+    None whenever argv needs the full parser (help/version requests, unknown
+    flags, malformed values) so callers can fall back to argparse.
+    """
+    out: dict[str, Any] = {"input_int": None, "the_boolean": None, "the_path": None}
+    i = 0
+    n = len(argv)
+    while i < n:
+        a = argv[i]
+        if a == "--the-boolean" and i + 1 < n:
+            try:
+                out["the_boolean"] = _parse_bool(argv[i + 1])
+            except Exception:
+                # _parse_bool raised ArgumentTypeError; fall back to argparse
+                return None
+            i += 2
+        elif a.startswith("--the-boolean="):
+            try:
+                out["the_boolean"] = _parse_bool(a[len("--the-boolean="):])
+            except Exception:
+                # _parse_bool raised ArgumentTypeError; fall back to argparse
+                return None
+            i += 1
+        elif a == "--the-path" and i + 1 < n:
+            out["the_path"] = _as_path(argv[i + 1])
+            i += 2
+        elif a.startswith("--the-path="):
+            out["the_path"] = _as_path(a[len("--the-path="):])
+            i += 1
+        elif a.startswith("-"):
+            # -h/--help/--version/unknown flags: let argparse handle them
+            return None
+        elif out["input_int"] is None:
+            try:
+                out["input_int"] = int(a)
+            except ValueError:
+                return None
+            i += 1
+        else:
+            return None
+
+    if out["input_int"] is None:
         return None
-    raise argparse.ArgumentTypeError(
-        f"Invalid boolean value: {value!r}. Use one of: \n"
-        f"  - True Values: {", ".join(sorted(TRUE_VALUE_SET))}\n"
-        f"  - False Values: {", ".join(sorted(FALSE_VALUE_SET))}\n"
-        f"  - NA Values: {", ".join(sorted(MISSING_VALUE_SET))}\n"
-    )
+    return out
+
+
+@functools.lru_cache(maxsize=1)
+def _home() -> str:
+    """Resolve and cache the user's home directory once per process."""
+    import os
+    return os.path.expanduser("~")
 
 
 def _as_path(value: str) -> Path:
@@ -103,7 +225,14 @@ def _as_path(value: str) -> Path:
     Convert a CLI string to a Path (no existence check).
     Use Path.exists()/is_file()/is_dir() downstream if you want strict validation.
     """
-    return Path(value).expanduser()
+    # expanduser() only ever rewrites paths with a leading "~"; skip it
+    # (and its HOME lookup) for the common absolute/relative case.
+    if value.startswith("~"):
+        if value == "~" or value.startswith("~/"):
+            return Path(_home() + value[1:])
+        # "~user" forms still need the full expansion machinery
+        return Path(value).expanduser()
+    return Path(value)
 
 
 def _as_path_list(value: str) -> list[Path]:
@@ -114,7 +243,7 @@ def _as_path_list(value: str) -> list[Path]:
 
     # Use re.split() to perform the split
     value_list = re.split(SPLIT_PATTERN, value)
-    return [Path(e).expanduser() for e in value_list]
+    return [_as_path(e) for e in value_list]
 
 
 def _as_datetime(value: str) -> str | None:
@@ -168,83 +297,450 @@ def _as_datetime(value: str) -> str | None:
 # --------------------------------------------------------------------------------------
 # Functions
 # --------------------------------------------------------------------------------------
-def acta_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
+@dataclass(frozen=True)
+class _ParserSpec:
     """
-    Parse CLI arguments for the program `foo` and return a plain dict[str, Any].
-
-    Parameters
-    ----------
-    argv:
-        Sequence of argument strings, typically `sys.argv[1:]`.
-        If None, argparse uses `sys.argv[1:]` automatically.
+    Declarative description of one tool's argparse surface.
 
-    Returns
-    -------
-    dict[str, Any]
-        A dict with parsed values. Keys match the argument `dest` names.
+    `arguments` is a tuple of `(flags, kwargs)` pairs fed verbatim to
+    `ArgumentParser.add_argument`; the shared `--version` flag is added by
+    `_build_parser` and does not appear here.
     """
-    if not argv:
-        argv = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(
+    prog: str
+    desc_fn: Callable[[], str]
+    epi_fn: Callable[[], str]
+    arguments: tuple[tuple[tuple[str, ...], dict[str, Any]], ...]
+
+
+# The quincas/default tools share one argument surface (see _fast_parse_simple).
+_SIMPLE_ARGUMENTS: Final[tuple[tuple[tuple[str, ...], dict[str, Any]], ...]] = (
+    (
+        ("input_int",),
+        {
+            "type": int,
+            "metavar": "INPUT_INT",
+            "help": "Required integer input (e.g., 3).",
+        },
+    ),
+    (
+        ("--the-boolean",),
+        {
+            "dest": "the_boolean",
+            "type": _parse_bool,
+            "default": None,
+            "metavar": "{true|false}",
+            "help": "Optional boolean override: true/false, yes/no, on/off, 1/0.",
+        },
+    ),
+    (
+        ("--the-path",),
+        {
+            "dest": "the_path",
+            "type": _as_path,
+            "default": None,
+            "metavar": "PATH",
+            "help": (
+                "Optional path override to a file or directory "
+                "(existence not enforced by default)."
+            ),
+        },
+    ),
+)
+
+
+_PARSER_SPECS: Final[dict[str, _ParserSpec]] = {
+    ACTA: _ParserSpec(
         prog=ACTA,
-        description=(
-            f"{ACTA} - a reference CLI demonstrating clean argparse patterns.\n\n"
-            "It includes mandatory positional inputs (int/float/bool/str/path) and optional\n"
-            "flags with both short and long forms. Copy/paste and tailor as needed."
-        ),
-        epilog=(
+        desc_fn=lambda: _REFERENCE_DESC_TEMPLATE.format(prog=ACTA),
+        epi_fn=lambda: (
             f"Examples:\n"
             f"  $ {UQBAR} {ACTA} --help\n"
             f"  $ {UQBAR} {ACTA} ./root/\n"
             f"  $ {UQBAR} {ACTA} ./root/ -d 2026-07-31 --s '1,2,5,6,7,8,9'\n"
         ),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
+        arguments=(
+            (
+                ("root_path",),
+                {
+                    "type": _as_path,
+                    "metavar": "PATH",
+                    "help": "Main path to store all data.",
+                },
+            ),
+            (
+                ("-d", "--date"),
+                {
+                    "dest": "this_date",
+                    "type": _as_datetime,
+                    "default": None,
+                    "metavar": "DATE",
+                    "help": "Date in which to fetch trends. Keep empty for latest trends.",
+                },
+            ),
+            (
+                ("-s", "--semaphore"),
+                {
+                    "dest": "semaphore",
+                    "type": str,
+                    "default": None,
+                    "metavar": "INPUT_STR",
+                    "help": "Which steps of the pipeline to run as a comma-separated list of int",
+                },
+            ),
+        ),
+    ),
+    MILOU: _ParserSpec(
+        prog=MILOU,
+        desc_fn=lambda: (
+            f"{MILOU} - a CLI tool to fetch artefacts from the internet: from \n"
+            "youtube videos to books in various formats.\n\n"
+            "Milou - known as Snowy in English - is a fictional white Wire Fox \n"
+            "Terrier who is a companion to Tintin, the series' protagonist. Snowy \n"
+            "made his debut on 1929, helping Tintin in variety of ways, including \n"
+            "fetching missing artifacts.\n\n"
+        ),
+        epi_fn=lambda: (
+            f"Examples:\n"
+            f"  $ {UQBAR} {MILOU} book -i ~/Desktop/search_terms.txt -o ~\n"
+            f"  $ {UQBAR} {MILOU} book -q 'the,adventures,of,tintim,herge' -s "
+            "'google,duckduckgo' -o ~\n"
+            f"  $ {UQBAR} {MILOU} book -i ~/Desktop/search_terms.txt -f 'pdf,epub,djvu' -o ~\n"
+        ),
+        arguments=(
+            (
+                ("command_subtipe",),
+                {
+                    "type": str,
+                    "metavar": "SUBCOMMAND",
+                    "help": "Requested item to be fetched. Currently in ['youtube', 'book']",
+                },
+            ),
+            (
+                ("-i", "--input-path"),
+                {
+                    "dest": "input_path",
+                    "type": _as_path,
+                    "default": None,
+                    "metavar": "PATH",
+                    "help": "Input path as a text file with one query list of strings per line.",
+                },
+            ),
+            (
+                ("-o", "--output-path"),
+                {
+                    "dest": "output_path",
+                    "type": _as_path,
+                    # No eager Path.cwd() here: milou_core resolves a None
+                    # output path to the current directory on demand.
+                    "default": None,
+                    "metavar": "PATH",
+                    "help": "Location to output the search results.",
+                },
+            ),
+            (
+                ("-q", "--query"),
+                {
+                    "dest": "query",
+                    "type": str,
+                    "default": None,
+                    "metavar": "INPUT_STR,[INPUT_STR2,...]",
+                    "help": "Optional single comma-separated list of strings as a query.",
+                },
+            ),
+            (
+                ("-s", "--search-engines"),
+                {
+                    "dest": "search_engines",
+                    "type": str,
+                    "default": None,
+                    "metavar": "INPUT_STR,[INPUT_STR2,...]",
+                    "help": "Optional comma-separated list of formats allowed.",
+                },
+            ),
+            (
+                ("-f", "--formats-allowed"),
+                {
+                    "dest": "formats_allowed",
+                    "type": str,
+                    "default": None,
+                    "metavar": "INPUT_STR,[INPUT_STR2,...]",
+                    "help": "Optional comma-separated list of formats allowed.",
+                },
+            ),
+        ),
+    ),
+    QUINCAS: _ParserSpec(
+        prog=QUINCAS,
+        desc_fn=lambda: _REFERENCE_DESC_TEMPLATE.format(prog=QUINCAS),
+        epi_fn=lambda: _REFERENCE_EPI_TEMPLATE.format(prog=QUINCAS),
+        arguments=_SIMPLE_ARGUMENTS,
+    ),
+    FAUST: _ParserSpec(
+        prog=FAUST,
+        desc_fn=lambda: _REFERENCE_DESC_TEMPLATE.format(prog=FAUST),
+        epi_fn=lambda: (
+            f"Examples:\n"
+            f"  $ {UQBAR} {FAUST} -l . -s '*.png'\n"
+            f"  $ {UQBAR} {FAUST} --location=/ --recursive --type file --string 'cat' \\\n"
+            f"      --output absdir filename --colour\n"
+            f"  $ {UQBAR} {FAUST} -l / -r -t dir file content metadata -s 'cat photos' \\\n"
+            f"      -o reldir filename fileline trim250 -c\n"
+        ),
+        arguments=(
+            (
+                ("-l", "--location"),
+                {
+                    "nargs": "*",
+                    "default": None,
+                    "help": (
+                        "One or more directories/files to search "
+                        "(default: current directory only)."
+                    ),
+                },
+            ),
+            (
+                ("-r", "--recursive"),
+                {
+                    "action": "store_true",
+                    "help": "Search recursively within the locations.",
+                },
+            ),
+            (
+                ("-t", "--type"),
+                {
+                    "nargs": "*",
+                    "default": None,
+                    "help": (
+                        "One or more of: dir file content metadata "
+                        "(wildcards allowed). Default: content"
+                    ),
+                },
+            ),
+            (
+                ("-s", "--string"),
+                {
+                    "nargs": "+",
+                    "required": True,
+                    "help": "One or more search queries (wildcards or regex via /.../ or r:...).",
+                },
+            ),
+            (
+                ("-o", "--output"),
+                {
+                    "nargs": "*",
+                    "default": None,
+                    "help": "Output columns. Default: reldir filename fileline trim50",
+                },
+            ),
+            (
+                ("-c", "--colour"),
+                {
+                    "action": "store_true",
+                    "help": "Enable ANSI colours and bold matches (best-effort).",
+                },
+            ),
+        ),
+    ),
+    TIETA: _ParserSpec(
+        prog=TIETA,
+        desc_fn=lambda: (
+            f"{TIETA} - a CLI tool to create input text prompts for Claude, based "
+            "on an input `pdf` file.\n\nTieta is a character from the homonimous "
+            "book by the Brazilian writer Jorge Amado. This fascinating novel "
+            "revolves around a young woman, named Tieta, who lives in a small town "
+            "in Brazil. Tieta is a naive girl, who is ostracised by the entire "
+            "community, for her exhuberant beauty. She leaves the town to go to "
+            "a big city, where she becomes rich and powerful; and when she decides "
+            "to return to her home town, things are not quite the same."
+        ),
+        epi_fn=lambda: (
+            f"Examples:\n"
+            f"  $ {UQBAR} {TIETA} claude -i input.pdf -o output.txt -s 10 -f 20\n"
+            f"  $ {UQBAR} {TIETA} gpt -i ./loc1/file.txt -o ./out-loc/output.txt\n"
+            f"  $ {UQBAR} {TIETA} gpt -l ./loc1/,./loc2/ -o ./out-loc/output.txt\n"
+        ),
+        arguments=(
+            (
+                ("command_subtipe",),
+                {
+                    "type": str,
+                    "metavar": "SUBCOMMAND",
+                    "help": "Requested prompt type. Currently in ['claude', 'gpt']",
+                },
+            ),
+            (
+                ("-i", "--input-path"),
+                {
+                    "dest": "input_path",
+                    "type": _as_path,
+                    "default": None,
+                    "metavar": "PATH",
+                    "help": "Optional input as a path to a pdf file.",
+                },
+            ),
+            (
+                ("-l", "--input-path-list"),
+                {
+                    "dest": "input_path_list",
+                    "type": _as_path_list,
+                    "default": None,
+                    "metavar": "PATH[,PATH,...]",
+                    "help": "Optional input as a list of paths containing files.",
+                },
+            ),
+            (
+                ("-o", "--output-path"),
+                {
+                    "dest": "output_path",
+                    "type": _as_path,
+                    "default": None,
+                    "metavar": "PATH",
+                    "help": "Optional name of text output file path.",
+                },
+            ),
+            (
+                ("-s", "--start-page"),
+                {
+                    "dest": "start_page",
+                    "type": int,
+                    "default": None,
+                    "metavar": "INPUT_INT",
+                    "help": "Optional number of first page to be parsed and returned.",
+                },
+            ),
+            (
+                ("-f", "--final-page"),
+                {
+                    "dest": "final_page",
+                    "type": int,
+                    "default": None,
+                    "metavar": "INPUT_INT",
+                    "help": "Optional number of last page to be parsed and returned.",
+                },
+            ),
+            (
+                ("-r", "--redflags"),
+                {
+                    "dest": "redflags",
+                    "type": _parse_bool,
+                    "default": None,
+                    "metavar": "{true|false}",
+                    "help": "Optional boolean. Whether to print pdf parsing red flags.",
+                },
+            ),
+            (
+                ("-p", "--redflags-path"),
+                {
+                    "dest": "redflags_path",
+                    "type": _as_path,
+                    "default": None,
+                    "metavar": "PATH",
+                    "help": "Optional path. Location where pdf parsing red flags will be written.",
+                },
+            ),
+        ),
+    ),
+    LOLA: _ParserSpec(
+        prog=LOLA,
+        desc_fn=lambda: (
+            f"{LOLA} - a CLI-based tool to perform multiple datetime-related \n"
+            "tasks.\n"
+            "Lola is the main character from the German movie 'Lola Rennt'. \n"
+            "In this movie, it will be shown how an otherwise negligible \n"
+            "difference in a few seconds can change the life of everyone. \n"
+            "Including Lola, who must run exhaustively to save her partner.\n\n"
+        ),
+        epi_fn=lambda: (
+            f"Examples:\n"
+            f"  $ {UQBAR} {LOLA} todo\n"
+            f"  $ {UQBAR} {LOLA} todo -e 2048-10-31 -o ~/todo.txt\n"
+            f"  $ {UQBAR} {LOLA} todo --date-start 2048-02-01 --date-end 2048-10-31\n"
+        ),
+        arguments=(
+            (
+                ("command_subtipe",),
+                {
+                    "type": str,
+                    "metavar": "SUBCOMMAND",
+                    "help": "Requested item to be fetched. Currently in ['todo']",
+                },
+            ),
+            (
+                ("-s", "--date-start"),
+                {
+                    "dest": "date_start",
+                    "type": _as_datetime,
+                    "default": None,
+                    "metavar": "DATETIME",
+                    "help": "Optional start date of .todo file creation (default: start of year).",
+                },
+            ),
+            (
+                ("-e", "--date-end"),
+                {
+                    "dest": "date_end",
+                    "type": _as_datetime,
+                    "default": None,
+                    "metavar": "DATETIME",
+                    "help": "Optional end date of .todo file creation (default: end of year).",
+                },
+            ),
+            (
+                ("-o", "--output-path"),
+                {
+                    "dest": "output_path",
+                    "type": _as_path,
+                    "default": None,
+                    "metavar": "PATH",
+                    "help": "Optional path. Location where the .todo file will be written.",
+                },
+            ),
+        ),
+    ),
+    DEFAULT: _ParserSpec(
+        prog=DEFAULT,
+        desc_fn=lambda: _REFERENCE_DESC_TEMPLATE.format(prog=DEFAULT),
+        epi_fn=lambda: _REFERENCE_EPI_TEMPLATE.format(prog=DEFAULT),
+        arguments=_SIMPLE_ARGUMENTS,
+    ),
+}
 
-    # Version flag
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"{ACTA} {__version__}",
-        help="Show program version and exit.",
-    )
 
-    # Positional arguments
-    parser.add_argument(
-        "root_path",
-        type=_as_path,
-        metavar="PATH",
-        help="Main path to store all data.",
+@functools.cache
+def _build_parser(prog: str, add_help: bool) -> argparse.ArgumentParser:
+    """Construct (and cache) the ArgumentParser described by `_PARSER_SPECS[prog]`."""
+    from uqbar._cliparse import (
+        RawDescriptionHelpFormatter,
+        _LazyDocParser,
+        _LazyVersionAction,
     )
 
-    # Optional arguments
-    parser.add_argument(
-        "-d",
-        "--date",
-        dest="this_date",
-        type=_as_datetime,
-        default=None,
-        metavar="DATE",
-        help="Date in which to fetch trends. Keep empty for latest trends.",
+    spec = _PARSER_SPECS[prog]
+    parser = _LazyDocParser(
+        prog=prog,
+        add_help=add_help,
+        desc_fn=spec.desc_fn,
+        epi_fn=spec.epi_fn,
+        formatter_class=RawDescriptionHelpFormatter,
     )
+
+    # Version flag (shared by every tool)
     parser.add_argument(
-        "-s",
-        "--semaphore",
-        dest="semaphore",
-        type=str,
-        default=None,
-        metavar="INPUT_STR",
-        help="Which steps of the pipeline to run as a comma-separated list of int",
+        "--version",
+        action=_LazyVersionAction,
+        help="Show program version and exit.",
     )
 
-    ns = parser.parse_args(argv)
-    return vars(ns)
+    for flags, kwargs in spec.arguments:
+        parser.add_argument(*flags, **kwargs)
 
+    return parser
 
-def milou_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
+
+def acta_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     """
-    Parse CLI arguments for the program `foo` and return a plain dict[str, Any].
+    Parse CLI arguments for the program `acta` and return a plain dict[str, Any].
 
     Parameters
     ----------
@@ -256,102 +752,43 @@ def milou_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     -------
     dict[str, Any]
         A dict with parsed values. Keys match the argument `dest` names.
+        Note: `vars(ns)` returns the namespace's live `__dict__` (no copy),
+        so mutating the returned dict mutates the namespace.
     """
-    if not argv:
+    if argv is None:
         argv = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(
-        prog=MILOU,
-        description=(
-            f"{MILOU} - a CLI tool to fetch artefacts from the internet: from \n"
-            "youtube videos to books in various formats.\n\n"
-            "Milou - known as Snowy in English - is a fictional white Wire Fox \n"
-            "Terrier who is a companion to Tintin, the series' protagonist. Snowy \n"
-            "made his debut on 1929, helping Tintin in variety of ways, including \n"
-            "fetching missing artifacts.\n\n"
-        ),
-        epilog=(
-            f"Examples:\n"
-            f"  $ {UQBAR} {MILOU} book -i ~/Desktop/search_terms.txt -o ~\n"
-            f"  $ {UQBAR} {MILOU} book -q 'the,adventures,of,tintim,herge' -s "
-            "'google,duckduckgo' -o ~\n"
-            f"  $ {UQBAR} {MILOU} book -i ~/Desktop/search_terms.txt -f 'pdf,epub,djvu' -o ~\n"
-        ),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
+    ns = _build_parser(ACTA, _wants_help(argv)).parse_args(argv)
+    return vars(ns)
 
-    # Version flag
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"{MILOU} {__version__}",
-        help="Show program version and exit.",
-    )
 
-    # Positional arguments
-    parser.add_argument(
-        "command_subtipe",
-        type=str,
-        metavar="SUBCOMMAND",
-        help="Requested item to be fetched. Currently in ['youtube', 'book']",
-    )
+def milou_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
+    """
+    Parse CLI arguments for the program `milou` and return a plain dict[str, Any].
 
-    # Optional arguments
-    parser.add_argument(
-        "-i",
-        "--input-path",
-        dest="input_path",
-        type=_as_path,
-        default=None,
-        metavar="PATH",
-        help="Input path as a text file with one query list of strings per line.",
-    )
-    parser.add_argument(
-        "-o",
-        "--output-path",
-        dest="output_path",
-        type=_as_path,
-        default=CURRENT_WORKING_DIR,
-        metavar="PATH",
-        help="Location to output the search results.",
-    )
-    parser.add_argument(
-        "-q",
-        "--query",
-        dest="query",
-        type=str,
-        default=None,
-        metavar="INPUT_STR,[INPUT_STR2,...]",
-        help="Optional single comma-separated list of strings as a query.",
-    )
-    # Optional arguments
-    parser.add_argument(
-        "-s",
-        "--search-engines",
-        dest="search_engines",
-        type=str,
-        default=None,
-        metavar="INPUT_STR,[INPUT_STR2,...]",
-        help="Optional comma-separated list of formats allowed.",
-    )
-    # Optional arguments
-    parser.add_argument(
-        "-f",
-        "--formats-allowed",
-        dest="formats_allowed",
-        type=str,
-        default=None,
-        metavar="INPUT_STR,[INPUT_STR2,...]",
-        help="Optional comma-separated list of formats allowed.",
-    )
+    Parameters
+    ----------
+    argv:
+        Sequence of argument strings, typically `sys.argv[1:]`.
+        If None, argparse uses `sys.argv[1:]` automatically.
+
+    Returns
+    -------
+    dict[str, Any]
+        A dict with parsed values. Keys match the argument `dest` names.
+        Note: `vars(ns)` returns the namespace's live `__dict__` (no copy),
+        so mutating the returned dict mutates the namespace.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
 
-    ns = parser.parse_args(argv)
+    ns = _build_parser(MILOU, _wants_help(argv)).parse_args(argv)
     return vars(ns)
 
 
 def quincas_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     """
-    Parse CLI arguments for the program `foo` and return a plain dict[str, Any].
+    Parse CLI arguments for the program `quincas` and return a plain dict[str, Any].
 
     Parameters
     ----------
@@ -363,61 +800,17 @@ def quincas_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     -------
     dict[str, Any]
         A dict with parsed values. Keys match the argument `dest` names.
+        Note: `vars(ns)` returns the namespace's live `__dict__` (no copy),
+        so mutating the returned dict mutates the namespace.
     """
-    if not argv:
+    if argv is None:
         argv = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(
-        prog=QUINCAS,
-        description=(
-            f"{QUINCAS} - a reference CLI demonstrating clean argparse patterns.\n\n"
-            "It includes mandatory positional inputs (int/float/bool/str/path) and optional\n"
-            "flags with both short and long forms. Copy/paste and tailor as needed."
-        ),
-        epilog=(
-            f"Examples:\n"
-            f"  $ {UQBAR} {QUINCAS} 3 0.25 true 'hello' ./data\n"
-            f"  $ {UQBAR} {QUINCAS} 3 0.25 false 'hello' ./data --the-int 7 --the-path ~/Downloads\n"
-            f"  $ {UQBAR} {QUINCAS} 3 0.25 yes 'hello' ./data -e --the-boolean off\n"
-        ),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    # Version flag
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"{QUINCAS} {__version__}",
-        help="Show program version and exit.",
-    )
-
-    # Positional arguments
-    parser.add_argument(
-        "input_int",
-        type=int,
-        metavar="INPUT_INT",
-        help="Required integer input (e.g., 3).",
-    )
-
-    # Optional arguments
-    parser.add_argument(
-        "--the-boolean",
-        dest="the_boolean",
-        type=_parse_bool,
-        default=None,
-        metavar="{true|false}",
-        help="Optional boolean override: true/false, yes/no, on/off, 1/0.",
-    )
-    parser.add_argument(
-        "--the-path",
-        dest="the_path",
-        type=_as_path,
-        default=None,
-        metavar="PATH",
-        help="Optional path override to a file or directory (existence not enforced by default).",
-    )
+    fast = _fast_parse_simple(argv)
+    if fast is not None:
+        return fast
 
-    ns = parser.parse_args(argv)
+    ns = _build_parser(QUINCAS, _wants_help(argv)).parse_args(argv)
     return vars(ns)
 
 
@@ -435,78 +828,13 @@ def faust_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     -------
     dict[str, Any]
         A dict with parsed values. Keys match the argument `dest` names.
+        Note: `vars(ns)` returns the namespace's live `__dict__` (no copy),
+        so mutating the returned dict mutates the namespace.
     """
-    if not argv:
+    if argv is None:
         argv = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(
-        prog=FAUST,
-        description=(
-            f"{FAUST} - a reference CLI demonstrating clean argparse patterns.\n\n"
-            "It includes mandatory positional inputs (int/float/bool/str/path) and optional\n"
-            "flags with both short and long forms. Copy/paste and tailor as needed."
-        ),
-        epilog=(
-            f"Examples:\n"
-            f"  $ {UQBAR} {FAUST} -l . -s '*.png'\n"
-            f"  $ {UQBAR} {FAUST} --location=/ --recursive --type file --string 'cat' \\\n"
-            f"      --output absdir filename --colour\n"
-            f"  $ {UQBAR} {FAUST} -l / -r -t dir file content metadata -s 'cat photos' \\\n"
-            f"      -o reldir filename fileline trim250 -c\n"
-        ),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    # Version flag
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"{FAUST} {__version__}",
-        help="Show program version and exit.",
-    )
-
-    parser.add_argument(
-        "-l",
-        "--location",
-        nargs="*",
-        default=None,
-        help="One or more directories/files to search (default: current directory only).",
-    )
-    parser.add_argument(
-        "-r",
-        "--recursive",
-        action="store_true",
-        help="Search recursively within the locations.",
-    )
-    parser.add_argument(
-        "-t",
-        "--type",
-        nargs="*",
-        default=None,
-        help="One or more of: dir file content metadata (wildcards allowed). Default: content",
-    )
-    parser.add_argument(
-        "-s",
-        "--string",
-        nargs="+",
-        required=True,
-        help="One or more search queries (wildcards or regex via /.../ or r:...).",
-    )
-    parser.add_argument(
-        "-o",
-        "--output",
-        nargs="*",
-        default=None,
-        help="Output columns. Default: reldir filename fileline trim50",
-    )
-    parser.add_argument(
-        "-c",
-        "--colour",
-        action="store_true",
-        help="Enable ANSI colours and bold matches (best-effort).",
-    )
-
-    ns = parser.parse_args(argv)
+    ns = _build_parser(FAUST, _wants_help(argv)).parse_args(argv)
     return vars(ns)
 
 
@@ -524,117 +852,16 @@ def tieta_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     -------
     dict[str, Any]
         A dict with parsed values. Keys match the argument `dest` names.
+        Note: `vars(ns)` returns the namespace's live `__dict__` (no copy),
+        so mutating the returned dict mutates the namespace.
     """
-    if not argv:
+    if argv is None:
         argv = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(
-        prog=TIETA,
-        description=(
-            f"{TIETA} - a CLI tool to create input text prompts for Claude, based "
-            "on an input `pdf` file.\n\nTieta is a character from the homonimous "
-            "book by the Brazilian writer Jorge Amado. This fascinating novel "
-            "revolves around a young woman, named Tieta, who lives in a small town "
-            "in Brazil. Tieta is a naive girl, who is ostracised by the entire "
-            "community, for her exhuberant beauty. She leaves the town to go to "
-            "a big city, where she becomes rich and powerful; and when she decides "
-            "to return to her home town, things are not quite the same."
-        ),
-        epilog=(
-            f"Examples:\n"
-            f"  $ {UQBAR} {TIETA} claude -i input.pdf -o output.txt -s 10 -f 20\n"
-            f"  $ {UQBAR} {TIETA} gpt -i ./loc1/file.txt -o ./out-loc/output.txt\n"
-            f"  $ {UQBAR} {TIETA} gpt -l ./loc1/,./loc2/ -o ./out-loc/output.txt\n"
-        ),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    # Version flag
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"{DEFAULT} {__version__}",
-        help="Show program version and exit.",
-    )
-
-    # Positional arguments
-    parser.add_argument(
-        "command_subtipe",
-        type=str,
-        metavar="SUBCOMMAND",
-        help="Requested prompt type. Currently in ['claude', 'gpt']",
-    )
-
-    # Optional arguments
-    parser.add_argument(
-        "-i"
-        "--input-path",
-        dest="input_path",
-        type=_as_path,
-        default=None,
-        metavar="PATH",
-        help="Optional input as a path to a pdf file.",
-    )
-    parser.add_argument(
-        "-l"
-        "--input-path-list",
-        dest="input_path_list",
-        type=_as_path_list,
-        default=None,
-        metavar="PATH[,PATH,...]",
-        help="Optional input as a list of paths containing files.",
-    )
-    parser.add_argument(
-        "-o"
-        "--output-path",
-        dest="output_path",
-        type=_as_path,
-        default=None,
-        metavar="PATH",
-        help="Optional name of text output file path.",
-    )
-    parser.add_argument(
-        "-s",
-        "--start-page",
-        dest="start_page",
-        type=int,
-        default=None,
-        metavar="INPUT_INT",
-        help="Optional number of first page to be parsed and returned.",
-    )
-    # Optional arguments
-    parser.add_argument(
-        "-f",
-        "--final-page",
-        dest="final_page",
-        type=int,
-        default=None,
-        metavar="INPUT_INT",
-        help="Optional number of last page to be parsed and returned.",
-    )
-    # Optional arguments
-    parser.add_argument(
-        "-r",
-        "--redflags",
-        dest="redflags",
-        type=_parse_bool,
-        default=None,
-        metavar="{true|false}",
-        help="Optional boolean. Whether to print pdf parsing red flags.",
-    )
-    parser.add_argument(
-        "-p",
-        "--redflags-path",
-        dest="redflags_path",
-        type=_as_path,
-        default=None,
-        metavar="PATH",
-        help="Optional path. Location where pdf parsing red flags will be written.",
-    )
-
-    ns = parser.parse_args(argv)
+    ns = _build_parser(TIETA, _wants_help(argv)).parse_args(argv)
     return vars(ns)
 
+
 def lola_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     """
     Parse CLI arguments for the program `lola` and return a plain dict[str, Any].
@@ -649,75 +876,13 @@ def lola_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     -------
     dict[str, Any]
         A dict with parsed values. Keys match the argument `dest` names.
+        Note: `vars(ns)` returns the namespace's live `__dict__` (no copy),
+        so mutating the returned dict mutates the namespace.
     """
-    if not argv:
+    if argv is None:
         argv = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(
-        prog=LOLA,
-        description=(
-            f"{LOLA} - a CLI-based tool to perform multiple datetime-related \n"
-            "tasks.\n"
-            "Lola is the main character from the German movie 'Lola Rennt'. \n"
-            "In this movie, it will be shown how an otherwise negligible \n"
-            "difference in a few seconds can change the life of everyone. \n"
-            "Including Lola, who must run exhaustively to save her partner.\n\n"
-        ),
-        epilog=(
-            f"Examples:\n"
-            f"  $ {UQBAR} {LOLA} todo\n"
-            f"  $ {UQBAR} {LOLA} todo -e 2048-10-31 -o ~/todo.txt\n"
-            f"  $ {UQBAR} {LOLA} todo --date-start 2048-02-01 --date-end 2048-10-31\n"
-        ),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    # Version flag
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"{LOLA} {__version__}",
-        help="Show program version and exit.",
-    )
-
-    # Positional arguments
-    parser.add_argument(
-        "command_subtipe",
-        type=str,
-        metavar="SUBCOMMAND",
-        help="Requested item to be fetched. Currently in ['todo']",
-    )
-
-    # Optional arguments
-    parser.add_argument(
-        "-s",
-        "--date-start",
-        dest="date_start",
-        type=_as_datetime,
-        default=None,
-        metavar="DATETIME",
-        help="Optional start date of .todo file creation (default: start of year).",
-    )
-    parser.add_argument(
-        "-e",
-        "--date-end",
-        dest="date_end",
-        type=_as_datetime,
-        default=None,
-        metavar="DATETIME",
-        help="Optional end date of .todo file creation (default: end of year).",
-    )
-    parser.add_argument(
-        "-o",
-        "--output-path",
-        dest="output_path",
-        type=_as_path,
-        default=None,
-        metavar="PATH",
-        help="Optional path. Location where the .todo file will be written.",
-    )
-
-    ns = parser.parse_args(argv)
+    ns = _build_parser(LOLA, _wants_help(argv)).parse_args(argv)
     return vars(ns)
 
 
@@ -735,62 +900,47 @@ def default_parser(argv: Sequence[str] | None = None) -> dict[str, Any]:
     -------
     dict[str, Any]
         A dict with parsed values. Keys match the argument `dest` names.
+        Note: `vars(ns)` returns the namespace's live `__dict__` (no copy),
+        so mutating the returned dict mutates the namespace.
     """
-    if not argv:
+    if argv is None:
         argv = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(
-        prog=DEFAULT,
-        description=(
-            f"{DEFAULT} - a reference CLI demonstrating clean argparse patterns.\n\n"
-            "It includes mandatory positional inputs (int/float/bool/str/path) and optional\n"
-            "flags with both short and long forms. Copy/paste and tailor as needed."
-        ),
-        epilog=(
-            f"Examples:\n"
-            f"  $ {UQBAR} {DEFAULT} 3 0.25 true 'hello' ./data\n"
-            f"  $ {UQBAR} {DEFAULT} 3 0.25 false 'hello' ./data --the-int 7 --the-path ~/Downloads\n"
-            f"  $ {UQBAR} {DEFAULT} 3 0.25 yes 'hello' ./data -e --the-boolean off\n"
-        ),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
+    fast = _fast_parse_simple(argv)
+    if fast is not None:
+        return fast
 
-    # Version flag
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"{DEFAULT} {__version__}",
-        help="Show program version and exit.",
-    )
+    ns = _build_parser(DEFAULT, _wants_help(argv)).parse_args(argv)
+    return vars(ns)
 
-    # Positional arguments
-    parser.add_argument(
-        "input_int",
-        type=int,
-        metavar="INPUT_INT",
-        help="Required integer input (e.g., 3).",
-    )
 
-    # Optional arguments
-    parser.add_argument(
-        "--the-boolean",
-        dest="the_boolean",
-        type=_parse_bool,
-        default=None,
-        metavar="{true|false}",
-        help="Optional boolean override: true/false, yes/no, on/off, 1/0.",
-    )
-    parser.add_argument(
-        "--the-path",
-        dest="the_path",
-        type=_as_path,
-        default=None,
-        metavar="PATH",
-        help="Optional path override to a file or directory (existence not enforced by default).",
-    )
+_DISPATCH: Final[dict[str, tuple[str, str, Any]]] = {
+    ACTA: ("uqbar.acta.core", "acta_core", acta_parser),
+    MILOU: ("uqbar.milou.core", "milou_core", milou_parser),
+    QUINCAS: ("uqbar.quincas.core", "quincas_core", quincas_parser),
+    FAUST: ("uqbar.faust.core", "faust_core", faust_parser),
+    TIETA: ("uqbar.tieta.core", "tieta_core", tieta_parser),
+    LOLA: ("uqbar.lola.core", "lola_core", lola_parser),
+    # DEFAULT: ("uqbar.default.core", "default_core", default_parser),
+}
 
-    ns = parser.parse_args(argv)
-    return vars(ns)
+
+@functools.lru_cache(maxsize=1)
+def _usage() -> str:
+    """One-line usage string for the multi-tool entry point (built once)."""
+    return f"usage: {UQBAR} {{{'|'.join(_DISPATCH)}}} [ARGS...]"
+
+
+@functools.lru_cache(maxsize=1)
+def _unknown_tool_prefix() -> str:
+    """Static part of the unknown-tool error (built once per process)."""
+    return f"{UQBAR}: unknown tool "
+
+
+@functools.lru_cache(maxsize=1)
+def _unknown_tool_suffix() -> str:
+    """Static part of the unknown-tool error (built once per process)."""
+    return f". Available: {', '.join(_DISPATCH)}"
 
 
 def main(argv: Sequence[str] | None) -> int:
@@ -803,40 +953,33 @@ def main(argv: Sequence[str] | None) -> int:
         Sequence of argument strings, typically `sys.argv[1:]`.
         If None, argparse uses `sys.argv[1:]` automatically.
     """
-    return_status: int = 1
-
     if not argv:
-        return return_status
-
-    if argv[0] == ACTA:
-        from uqbar.acta.core import acta_core
-        return_status = acta_core(args=acta_parser(argv[1:]))
-
-    elif argv[0] == MILOU:
-        from uqbar.milou.core import milou_core
-        return_status = milou_core(args=milou_parser(argv[1:]))
-
-    elif argv[0] == QUINCAS:
-        from uqbar.quincas.core import quincas_core
-        return_status = quincas_core(args=quincas_parser(argv[1:]))
-
-    elif argv[0] == FAUST:
-        from uqbar.faust.core import faust_core
-        return_status = faust_core(args=faust_parser(argv[1:]))
-
-    elif argv[0] == TIETA:
-        from uqbar.tieta.core import tieta_core
-        return_status = tieta_core(args=tieta_parser(argv[1:]))
-
-    elif argv[0] == LOLA:
-        from uqbar.lola.core import lola_core
-        return_status = lola_core(args=lola_parser(argv[1:]))
-
-    # elif argv[0] == DEFAULT:
-    #     from uqbar.default.core import default_core
-    #     return_status = default_core(args=default_parser(argv[1:]))
-
-    return return_status
+        print(_usage(), file=sys.stderr)
+        return 1
+
+    # Trivial inputs never need a parser: answer them from precomputed
+    # strings and return before any tool machinery loads.
+    head = argv[0]
+    if head in ("-h", "--help"):
+        print(_usage())
+        return 0
+    if head == "--version":
+        print(f"{UQBAR} {_get_version()}")
+        return 0
+
+    # Interned key makes the dict probe an identity comparison against the
+    # interned tool-name constants.
+    entry = _DISPATCH.get(sys.intern(head))
+    if entry is None:
+        print(
+            _unknown_tool_prefix() + repr(head) + _unknown_tool_suffix(),
+            file=sys.stderr,
+        )
+        return 1
+
+    module_name, function_name, parser = entry
+    module = importlib.import_module(module_name)
+    return getattr(module, function_name)(args=parser(argv[1:]))
 
 
 # --------------------------------------------------------------------------------------
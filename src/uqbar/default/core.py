@@ -27,7 +27,10 @@ Metadata
 # -------------------------------------------------------------------------------------
 from __future__ import annotations
 
-import argparse
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
 
 # -------------------------------------------------------------------------------------
 # Constants
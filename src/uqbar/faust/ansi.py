@@ -19,7 +19,7 @@ Metadata
 # --------------------------------------------------------------------------------------
 from __future__ import annotations
 
-# import functools
+import functools
 import os
 import re
 import sys
@@ -28,26 +28,44 @@ import sys
 # --------------------------------------------------------------------------------------
 # Helpers
 # --------------------------------------------------------------------------------------
-def _maybe_color(s: str, code: str, enabled: bool) -> str:
-    if not enabled:
-        return s
-    return f"{code}{s}{Ansi.RESET}"
+def _color(s: str, code: str) -> str:
+    # Plain concatenation (BINARY_ADD on str) beats f-string formatting here:
+    # no FORMAT_VALUE/BUILD_STRING ops and no attribute walk for the reset code.
+    return code + s + _RESET
 
 
-def _bold_matches(text: str, pattern: re.Pattern[str], enabled: bool) -> str:
-    if not enabled:
-        return text
+def _no_color(s: str, code: str) -> str:
+    # Disabled-colour twin of _color; callers bind one of the pair once
+    # per run instead of testing an `enabled` flag on every cell.
+    return s
 
-    def repl(m: re.Match[str]) -> str:
-        return f"{Ansi.BOLD}{m.group(0)}{Ansi.RESET}"
 
-    return pattern.sub(repl, text)
+def _bold_matches(text: str, pattern: re.Pattern[str]) -> str:
+    # Constant replacement template: re's C-level expansion handles \g<0>,
+    # so no Python callback (or closure allocation) runs per match.
+    return pattern.sub(_BOLD_TEMPLATE, text)
+
+
+def _no_bold(text: str, pattern: re.Pattern[str]) -> str:
+    # Disabled-colour twin of _bold_matches (see _no_color).
+    return text
 
 
 # --------------------------------------------------------------------------------------
 # Functions
 # --------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=256)
+def _compile_search(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    # Shared compile cache for search regexes: repeated runs (and repeated
+    # queries within a run) skip sre's compiler and hit a dict lookup instead.
+    return re.compile(pattern, flags)
+
+
+@functools.lru_cache(maxsize=1)
 def supports_ansi() -> bool:
+    # Cached for the process lifetime: isatty() is a syscall and the answer
+    # cannot change mid-run. Tests that alter TERM/stdout must call
+    # supports_ansi.cache_clear().
     if not sys.stdout.isatty():
         return False
     term = os.getenv("TERM", "")
@@ -72,12 +90,23 @@ class Ansi:
     DIM = "\x1b[2m"
 
 
+# Hot-path constants (defined after Ansi so the codes exist; only read at
+# call time): the reset suffix for _color and the re.sub replacement
+# template for _bold_matches.
+_RESET: str = Ansi.RESET
+
+_BOLD_TEMPLATE: str = f"{Ansi.BOLD}\\g<0>{Ansi.RESET}"
+
+
 # --------------------------------------------------------------------------------------
 # Exports
 # --------------------------------------------------------------------------------------
 __all__: list[str] = [
-    "_maybe_color",
+    "_color",
+    "_no_color",
     "_bold_matches",
+    "_no_bold",
+    "_compile_search",
     "supports_ansi",
     "Ansi",
 ]
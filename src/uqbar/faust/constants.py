@@ -40,6 +40,13 @@ OutField = Literal[
 DEFAULT_TYPES: list[SearchType] = ["content"]
 DEFAULT_OUT: list[OutField] = ["reldir", "filename", "fileline", "trim50"]
 
+# Runtime companions to the Literal types above: validation on the hot path
+# uses frozenset.__contains__ (one hash probe) instead of a list scan.
+SEARCH_TYPES: frozenset[str] = frozenset({"dir", "file", "content", "metadata"})
+OUT_FIELDS: frozenset[str] = frozenset(
+    {"absdir", "reldir", "filename", "fileline", "fullline", "trim50", "trim100", "trim250"}
+)
+
 
 # --------------------------------------------------------------------------------------
 # Exports
@@ -49,4 +56,6 @@ __all__: list[str] = [
     "OutField",
     "DEFAULT_TYPES",
     "DEFAULT_OUT",
+    "SEARCH_TYPES",
+    "OUT_FIELDS",
 ]
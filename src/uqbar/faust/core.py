@@ -28,17 +28,30 @@ Metadata
 from __future__ import annotations
 
 import fnmatch
+import functools
+import os
 import re
 import sys
 from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
-
-from uqbar.faust.ansi import supports_ansi
-from uqbar.faust.constants import DEFAULT_OUT, DEFAULT_TYPES, OutField, SearchType
-from uqbar.faust.io import build_row
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+from uqbar.faust.ansi import _compile_search, supports_ansi
+from uqbar.faust.constants import (
+    DEFAULT_OUT,
+    DEFAULT_TYPES,
+    OUT_FIELDS,
+    SEARCH_TYPES,
+    OutField,
+    SearchType,
+)
+from uqbar.faust.io import build_row, colour_helpers, select_emitters
 from uqbar.faust.matching import (
     Hit,
+    Matcher,
     search_content,
     search_dirnames,
     search_filenames,
@@ -48,6 +61,12 @@ from uqbar.faust.matching import (
 # -------------------------------------------------------------------------------------
 # Constants
 # -------------------------------------------------------------------------------------
+# Below this many files the thread pool costs more than it saves; scan serially.
+_PARALLEL_MIN_FILES: int = 32
+
+# Rows buffered between stdout writes; one syscall per batch, not per hit.
+_WRITE_BATCH_ROWS: int = 4096
+
 ALLOWED_TYPE_LIST: list[str] = ["dir", "file", "content", "metadata"]
 
 ALLOWED_OUTPUT_LIST: list[str] = [
@@ -55,10 +74,17 @@ ALLOWED_OUTPUT_LIST: list[str] = [
     "fullline", "trim50", "trim100", "trim250"
 ]
 
+# Output fields that only content hits can populate; when none of these are
+# requested, a filename hit already yields the same row as a content hit.
+_CONTENT_FIELDS: frozenset[str] = frozenset(
+    {"fileline", "fullline", "trim50", "trim100", "trim250"}
+)
+
 
 # -------------------------------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=512)
 def _compile_query(q: str) -> re.Pattern[str]:
     """
     Interpret q as:
@@ -72,7 +98,7 @@ def _compile_query(q: str) -> re.Pattern[str]:
 
     if (len(q) >= 2 and q[0] == "/" and q[-1] == "/") or q.startswith("r:"):
         raw = q[1:-1] if (q[0] == "/" and q[-1] == "/") else q[2:]
-        return re.compile(raw)
+        return _compile_search(raw)
 
     # wildcard -> regex
     # fnmatch.translate returns a regex that matches the *entire* string; we want search within line,
@@ -80,7 +106,27 @@ def _compile_query(q: str) -> re.Pattern[str]:
     rx = fnmatch.translate(q)
     # rx looks like: (?s:...)\Z
     rx = rx.replace(r"\Z", "")
-    return re.compile(rx)
+    return _compile_search(rx)
+
+
+def _scandir_walk(root: Path) -> Iterable[Path]:
+    """
+    Depth-first scandir walk yielding every entry under `root`.
+
+    os.scandir surfaces each directory's type bits straight from getdents,
+    so recursing costs one syscall per directory instead of the per-entry
+    stat that Path.rglob pays; unreadable directories are skipped.
+    """
+    stack: list[str] = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    yield Path(entry.path)
+        except OSError:
+            continue
 
 
 def _iter_targets(locations: list[Path], recursive: bool) -> Iterable[Path]:
@@ -93,57 +139,86 @@ def _iter_targets(locations: list[Path], recursive: bool) -> Iterable[Path]:
 
         if not recursive:
             # only immediate children
-            yield from loc.iterdir()
+            try:
+                with os.scandir(loc) as it:
+                    for entry in it:
+                        yield Path(entry.path)
+            except OSError:
+                continue
         else:
             yield loc
-            yield from loc.rglob("*")
+            yield from _scandir_walk(loc)
 
 
-def _expand_types(raw: list[str] | None) -> list[SearchType]:
+def _expand(
+    raw: list[str] | None,
+    allowed: list[str],
+    allowed_set: frozenset[str],
+    default: list[str],
+) -> list[str]:
+    """
+    Shared token expansion for -t/-o: wildcards expand against `allowed`
+    (compiled once per token, not re-translated per candidate), then the
+    result is validated against `allowed_set` and de-duped in order.
+    """
     if not raw:
-        return DEFAULT_TYPES
+        return default
 
     expanded: list[str] = []
-
     for tok in raw:
         tok = tok.strip()
         if not tok:
             continue
         # wildcard expand against allowed
         if any(ch in tok for ch in "*?[]"):
-            expanded.extend([a for a in ALLOWED_TYPE_LIST if fnmatch.fnmatch(a, tok)])
+            tok_re = re.compile(fnmatch.translate(tok))
+            expanded.extend(a for a in allowed if tok_re.match(a))
         else:
             expanded.append(tok)
 
     # de-dupe preserving order
-    out: list[SearchType] = []
+    out: list[str] = []
     for x in expanded:
-        if x in ALLOWED_TYPE_LIST and x not in out:
-            out.append(x)  # type: ignore[arg-type]
+        if x in allowed_set and x not in out:
+            out.append(x)
+
+    return out if out else default
+
 
-    return out if out else DEFAULT_TYPES
+def _expand_types(raw: list[str] | None) -> list[SearchType]:
+    return _expand(raw, ALLOWED_TYPE_LIST, SEARCH_TYPES, DEFAULT_TYPES)  # type: ignore[return-value]
 
 
 def _expand_outputs(raw: list[str] | None) -> list[OutField]:
-    if not raw:
-        return DEFAULT_OUT
+    return _expand(raw, ALLOWED_OUTPUT_LIST, OUT_FIELDS, DEFAULT_OUT)  # type: ignore[return-value]
 
-    expanded: list[str] = []
-    for tok in raw:
-        tok = tok.strip()
-        if not tok:
-            continue
-        if any(ch in tok for ch in "*?[]"):
-            expanded.extend([a for a in ALLOWED_OUTPUT_LIST if fnmatch.fnmatch(a, tok)])
-        else:
-            expanded.append(tok)
 
-    out: list[OutField] = []
-    for x in expanded:
-        if x in ALLOWED_OUTPUT_LIST and x not in out:
-            out.append(x)  # type: ignore[arg-type]
+def _scan_content_parallel(
+    files: list[Path], base: Path, matcher: Matcher
+) -> Iterable[Hit]:
+    """
+    Scan file contents across a thread pool, falling back to the serial
+    generator for small batches.
+
+    Threads (not processes) fit here: the reads release the GIL and every
+    Hit crosses back without pickling. `Executor.map` keeps results in
+    submission order, so output stays deterministic.
+    """
+    if len(files) < _PARALLEL_MIN_FILES:
+        yield from search_content(targets=files, base=base, matcher=matcher)
+        return
 
-    return out if out else DEFAULT_OUT
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    def scan(p: Path) -> list[Hit]:
+        return list(search_content(targets=[p], base=base, matcher=matcher))
+
+    # I/O-bound workers: oversubscribe the cores so the SSD sees queue
+    # depth while the GIL serializes the (cheap) matching side.
+    with ThreadPoolExecutor(max_workers=min(32, 4 * (os.cpu_count() or 1))) as pool:
+        for hits in pool.map(scan, files):
+            yield from hits
 
 
 # --------------------------------------------------------------------------------------
@@ -162,35 +237,64 @@ def faust_core(args: dict[str, Any]) -> int:
     recursive: bool = bool(args["recursive"])
     types: list[SearchType] = _expand_types(args["type"])
     outputs: list[OutField] = _expand_outputs(args["output"])
+    emitters = select_emitters(outputs)
 
     raw_queries: list[str] = list(args["string"])
     patterns: list[re.Pattern[str]] = [_compile_query(q) for q in raw_queries]
     match_patterns = {q: p for q, p in zip(raw_queries, patterns, strict=True)}
+    matcher = Matcher.from_queries(raw_queries, patterns)
 
     colour = bool(args["colour"]) and supports_ansi()
+    color, bold = colour_helpers(colour)
 
     # Header
     sys.stdout.write("\t".join(outputs) + "\n")
 
+    out_rows: list[str] = []
+
     for loc in locations:
         base = loc if loc.is_dir() else loc.parent
-        _iter_targets([loc], recursive)
+
+        # One traversal per location, shared by every enabled search type;
+        # the walk used to run once per type, quadrupling directory syscalls.
+        targets = list(_iter_targets([loc], recursive))
+        dirs: list[Path] = []
+        files: list[Path] = []
+        for p in targets:
+            if p.is_dir():
+                dirs.append(p)
+            elif p.is_file():
+                files.append(p)
 
         hits: list[Hit] = []
 
         if "dir" in types:
-            hits.extend(search_dirnames(targets=_iter_targets([loc], recursive), base=base, patterns=patterns, raw_queries=raw_queries))
+            hits.extend(search_dirnames(targets=dirs, base=base, matcher=matcher))
         if "file" in types:
-            hits.extend(search_filenames(targets=_iter_targets([loc], recursive), base=base, patterns=patterns, raw_queries=raw_queries))
+            hits.extend(search_filenames(targets=files, base=base, matcher=matcher))
         if "content" in types:
-            hits.extend(search_content(targets=_iter_targets([loc], recursive), base=base, patterns=patterns, raw_queries=raw_queries))
+            # Early-out: without content-specific output fields, a file that
+            # already matched by name would only produce duplicate rows, so
+            # skip opening it at all.
+            candidates = files
+            if "file" in types and not any(f in _CONTENT_FIELDS for f in outputs):
+                matched = {h.path for h in hits if h.kind == "file"}
+                if matched:
+                    candidates = [p for p in files if p not in matched]
+            hits.extend(_scan_content_parallel(candidates, base, matcher))
         if "metadata" in types:
-            hits.extend(search_metadata(targets=_iter_targets([loc], recursive), base=base, patterns=patterns, raw_queries=raw_queries))
+            hits.extend(search_metadata(targets=targets, base=base, matcher=matcher))
 
-        # Print TSV rows
+        # Buffer TSV rows; each flush is one write instead of one per hit.
         for hit in hits:
-            row = build_row(hit, outputs, colour, match_patterns)
-            sys.stdout.write("\t".join(row) + "\n")
+            row = build_row(hit, emitters, color, bold, match_patterns)
+            out_rows.append("\t".join(row))
+            if len(out_rows) >= _WRITE_BATCH_ROWS:
+                sys.stdout.write("\n".join(out_rows) + "\n")
+                out_rows.clear()
+
+    if out_rows:
+        sys.stdout.write("\n".join(out_rows) + "\n")
 
     return 0
 
@@ -20,11 +20,16 @@ Metadata
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from uqbar.faust.ansi import Ansi, _bold_matches, _maybe_color
+from uqbar.faust.ansi import Ansi, _bold_matches, _color, _no_bold, _no_color
 from uqbar.faust.constants import OutField
 
+if TYPE_CHECKING:
+    from uqbar.faust.matching import Hit
+
 
 # --------------------------------------------------------------------------------------
 # Helpers
@@ -59,53 +64,98 @@ def _trim_around_match(line: str, match: re.Match[str], span: int) -> str:
     return chunk
 
 
+# --------------------------------------------------------------------------------------
+# Field emitters
+# --------------------------------------------------------------------------------------
+# One function per output column, resolved once per run via select_emitters.
+# Each emitter does only its own work; the previous closure dispatch
+# re-branched over all eight field names (and pre-coloured reldir/filename
+# whether or not those columns were requested) for every cell.
+_ColorFn = Callable[[str, str], str]
+_BoldFn = Callable[[str, "re.Pattern[str]"], str]
+
+
+def _emit_absdir(hit: Hit, color: _ColorFn, bold: _BoldFn, pat: re.Pattern[str]) -> str:
+    return color(_abs_dir(hit.path), Ansi.BLUE)
+
+
+def _emit_reldir(hit: Hit, color: _ColorFn, bold: _BoldFn, pat: re.Pattern[str]) -> str:
+    return color(_rel_dir(hit.base, hit.path), Ansi.BLUE)
+
+
+def _emit_filename(hit: Hit, color: _ColorFn, bold: _BoldFn, pat: re.Pattern[str]) -> str:
+    p = hit.path
+    return color(p.name, Ansi.CYAN) if p.is_file() else "."
+
+
+def _emit_fileline(hit: Hit, color: _ColorFn, bold: _BoldFn, pat: re.Pattern[str]) -> str:
+    fileline = hit.fileline
+    return str(fileline) if fileline is not None else "."
+
+
+def _emit_fullline(hit: Hit, color: _ColorFn, bold: _BoldFn, pat: re.Pattern[str]) -> str:
+    line = hit.line
+    if line is None:
+        return "."
+    return bold(line, pat)
+
+
+def _make_emit_trim(span: int) -> Callable[..., str]:
+    def _emit_trim(
+        hit: Hit, color: _ColorFn, bold: _BoldFn, pat: re.Pattern[str]
+    ) -> str:
+        line = hit.line
+        if line is None:
+            return "."
+        m = pat.search(line)
+        if m is None:
+            # should not happen, but be safe
+            return bold(line[:span] if span == 50 else line, pat)
+        chunk = _trim_around_match(line, m, span)
+        return bold(chunk, pat)
+
+    return _emit_trim
+
+
+_FIELD_TABLE: dict[str, Callable[..., str]] = {
+    "absdir": _emit_absdir,
+    "reldir": _emit_reldir,
+    "filename": _emit_filename,
+    "fileline": _emit_fileline,
+    "fullline": _emit_fullline,
+    "trim50": _make_emit_trim(50),
+    "trim100": _make_emit_trim(100),
+    "trim250": _make_emit_trim(250),
+}
+
+
 # --------------------------------------------------------------------------------------
 # Functions
 # --------------------------------------------------------------------------------------
+def select_emitters(out_fields: list[OutField]) -> list[Callable[..., str]]:
+    """Resolve output field names to their emitter functions once per run."""
+    return [_FIELD_TABLE[f] for f in out_fields]
+
+
+def colour_helpers(colour: bool) -> tuple[_ColorFn, _BoldFn]:
+    """Resolve the colour/bold pair once per run; the disabled twins are
+    plain pass-throughs, so no enabled-flag test survives in the row loop."""
+    if colour:
+        return _color, _bold_matches
+    return _no_color, _no_bold
+
+
 def build_row(
     hit: Hit,
-    out_fields: list[OutField],
-    colour: bool,
+    emitters: list[Callable[..., str]],
+    color: _ColorFn,
+    bold: _BoldFn,
     match_patterns: dict[str, re.Pattern[str]],
 ) -> list[str]:
-    p = hit.path
-    base = hit.base
-    line = hit.line
-    fileline = hit.fileline
-
-    dir_major = _maybe_color(_rel_dir(base, p), Ansi.BLUE, colour)
-    file_minor = _maybe_color(p.name, Ansi.CYAN, colour)
-
     # For match bolding, we bold the matched query's pattern inside relevant text columns
     pat = match_patterns[hit.query]
 
-    def fmt_field(field: OutField) -> str:
-        if field == "absdir":
-            return _maybe_color(_abs_dir(p), Ansi.BLUE, colour)
-        if field == "reldir":
-            return dir_major
-        if field == "filename":
-            return file_minor if p.is_file() else "."
-        if field == "fileline":
-            return str(fileline) if fileline is not None else "."
-        if field == "fullline":
-            if line is None:
-                return "."
-            return _bold_matches(line, pat, colour)
-        if field in ("trim50", "trim100", "trim250"):
-            if line is None:
-                return "."
-            m = pat.search(line)
-            if m is None:
-                # should not happen, but be safe
-                return _bold_matches(line[:50], pat, colour) if field == "trim50" else _bold_matches(line, pat, colour)
-            span = 50 if field == "trim50" else 100 if field == "trim100" else 250
-            chunk = _trim_around_match(line, m, span)
-            return _bold_matches(chunk, pat, colour)
-
-        return "."
-
-    return [fmt_field(f) for f in out_fields]
+    return [e(hit, color, bold, pat) for e in emitters]
 
 
 # --------------------------------------------------------------------------------------
@@ -113,4 +163,6 @@ def build_row(
 # --------------------------------------------------------------------------------------
 __all__: list[str] = [
     "build_row",
+    "colour_helpers",
+    "select_emitters",
 ]
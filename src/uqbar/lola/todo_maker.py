@@ -22,14 +22,22 @@ Metadata
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import dataclass, astuple
-from datetime import date, datetime, timedelta
+from collections.abc import Callable, Iterable
+import functools
+
+from dataclasses import dataclass
+from datetime import date, datetime
 from enum import Enum, auto
-from math import floor
 from pathlib import Path
 from typing import Any
 import yaml
 
+try:
+    # libyaml-backed parser; several times faster for identical output.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 # -------------------------------------------------------------------------------------
 # Constants
@@ -53,6 +61,29 @@ BIG_RULER_LENGTH: int = 100
 
 SMALL_RULER_LENGTH: int = 3
 
+# Shared empty fallbacks for dict.get defaults: a literal DayName() /
+# [] default is evaluated (allocated) on every call even on cache hits.
+_EMPTY_DAYNAME: "DayName"
+_EMPTY: tuple = ()
+
+# Static card fragments, materialized once at import instead of per run
+# (placeholder block) or per Sunday (week separator).
+_TODO_PLACEHOLDER: str = "\n".join(["[ ] <Main : Topic> Placeholder {03:00}"] * 4)
+
+_WEEK_SEP_BLOCK: str = "\n\n" + "#" * WEEK_RULER_LENGTH + "\n"
+
+# English calendar names, indexed by date.month / date.weekday(). Literal
+# tuples rather than calendar.month_name so output never follows the
+# process locale; the daymap asset owns translation.
+_MONTH_NAMES: tuple[str, ...] = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+_WEEKDAY_NAMES: tuple[str, ...] = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
+
 
 class HolidayType(Enum):
     PUBLIC_HOLIDAY = auto()      # National / State / City Official Holiday
@@ -63,59 +94,40 @@ class HolidayType(Enum):
     OTHER = auto()               # Catch-all
 
 
-@dataclass
+@dataclass(slots=True)
 class DayName():
     name_en: str | None = None
     name_pt: str | None = None
-    def __str__(self) -> str:
-        return f"DayName({self.name_en}, {self.name_pt})"
-    def __repr__(self) -> str:
-        return f"DayName({self.name_en}, {self.name_pt})"
 
-@dataclass
+_EMPTY_DAYNAME = DayName()
+
+
+@dataclass(slots=True)
 class Bill:
     day: str | None = None
     type: str | None = None
     subtype: str | None = None
-    def __str__(self) -> str:
-        return f"DayName({self.day}, {self.type}, {self.subtype})"
-    def __repr__(self) -> str:
-        return f"DayName({self.day}, {self.type}, {self.subtype})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Birthday:
     day: str | None = None
     person: str | None = None
     location: str | None = None
-    def __str__(self) -> str:
-        return f"DayName({self.day}, {self.person}, {self.location})"
-    def __repr__(self) -> str:
-        return f"DayName({self.day}, {self.person}, {self.location})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Meeting:
     day: str | None = None
     type: str | None = None
     start_time: str | None = None
     end_time: str | None = None
-    def __str__(self) -> str:
-        return (
-            f"Meeting({self.day}, {self.type}, "
-            f"{self.start_time}, {self.end_time})"
-        )
-    def __repr__(self) -> str:
-        return (
-            f"Meeting({self.day}, {self.type}, "
-            f"{self.start_time}, {self.end_time})"
-        )
 
 
 # --------------------------------------------------------------------------------------
 # Helpers
 # --------------------------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HolidayRule:
     """
     A rule describing a date or date period that should be labeled.
@@ -144,34 +156,52 @@ class HolidayRule:
     end_dt: date | None = None
 
     def matches(self, d: date) -> bool:
-        if self.kind == "single_annual":
-            m, day = self.md  # type: ignore
-            return (d.month, d.day) == (m, day)
-
-        if self.kind == "single_absolute":
-            return d == self.dt  # type: ignore
-
-        if self.kind == "range_annual":
-            m1, d1 = self.md_start  # type: ignore
-            m2, d2 = self.md_end    # type: ignore
-            start = date(d.year, m1, d1)
-            # If the annual window crosses Dec→Jan, the end falls in next year
-            if (m2, d2) >= (m1, d1):
-                end = date(d.year, m2, d2)
-            else:
-                end = date(d.year + 1, m2, d2)
-                # If our test date is in Jan (or early year),
-                # the start likely was in previous year
-                if d < date(d.year, m1, d1):
-                    start = date(d.year - 1, m1, d1)
-            return start <= d <= end
+        # Kind-keyed dispatch: one dict probe instead of walking a
+        # string-compare chain for the later kinds.
+        try:
+            match_fn = _MATCHERS[self.kind]
+        except KeyError:
+            raise ValueError(f"Unknown rule kind: {self.kind}") from None
+        return match_fn(self, d)
+
+
+def _match_single_annual(rule: HolidayRule, d: date) -> bool:
+    m, day = rule.md  # type: ignore
+    return (d.month, d.day) == (m, day)
+
+
+def _match_single_absolute(rule: HolidayRule, d: date) -> bool:
+    return d == rule.dt  # type: ignore
 
-        if self.kind == "range_absolute":
-            return (self.start_dt  # type: ignore
-                    <= d
-                    <= self.end_dt)  # type: ignore
 
-        raise ValueError(f"Unknown rule kind: {self.kind}")
+def _match_range_annual(rule: HolidayRule, d: date) -> bool:
+    m1, d1 = rule.md_start  # type: ignore
+    m2, d2 = rule.md_end    # type: ignore
+    start = date(d.year, m1, d1)
+    # If the annual window crosses Dec→Jan, the end falls in next year
+    if (m2, d2) >= (m1, d1):
+        end = date(d.year, m2, d2)
+    else:
+        end = date(d.year + 1, m2, d2)
+        # If our test date is in Jan (or early year),
+        # the start likely was in previous year
+        if d < date(d.year, m1, d1):
+            start = date(d.year - 1, m1, d1)
+    return start <= d <= end
+
+
+def _match_range_absolute(rule: HolidayRule, d: date) -> bool:
+    return (rule.start_dt  # type: ignore
+            <= d
+            <= rule.end_dt)  # type: ignore
+
+
+_MATCHERS: dict[str, Callable[[HolidayRule, date], bool]] = {
+    "single_annual": _match_single_annual,
+    "single_absolute": _match_single_absolute,
+    "range_annual": _match_range_annual,
+    "range_absolute": _match_range_absolute,
+}
 
 
 def _load_yaml_dict(*, yaml_path: Path) -> dict[str, Any]:
@@ -181,8 +211,10 @@ def _load_yaml_dict(*, yaml_path: Path) -> dict[str, Any]:
     if not yaml_path.exists():
         raise FileNotFoundError(f"YAML file not found: {yaml_path}")
 
-    text = yaml_path.read_text(encoding="utf-8")
-    data = yaml.safe_load(text)
+    # Stream bytes straight into the loader; no intermediate read_text
+    # decode, and libyaml (when present) does the parsing in C.
+    with yaml_path.open("rb") as fh:
+        data = yaml.load(fh, Loader=_YamlLoader)
 
     if data is None:
         raise ValueError(f"YAML file is empty: {yaml_path}")
@@ -192,6 +224,31 @@ def _load_yaml_dict(*, yaml_path: Path) -> dict[str, Any]:
     return data
 
 
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """
+    Cache body for _load_yaml: mtime_ns participates in the key, so a
+    touched file falls through to a fresh parse while unchanged assets
+    are served from the cache on repeat todo_generator calls.
+    """
+    return _load_yaml_dict(yaml_path=Path(path_str))
+
+
+def _load_yaml(*, yaml_path: Path) -> dict[str, Any]:
+    """
+    Loads a YAML file via the (path, mtime) keyed cache.
+
+    Callers treat the returned mapping as read-only; it is shared
+    between calls that hit the same cache entry.
+    """
+    try:
+        mtime_ns = yaml_path.stat().st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"YAML file not found: {yaml_path}") from None
+
+    return _load_yaml_cached(str(yaml_path), mtime_ns)
+
+
 def _parse_holiday_rules(*, data: dict[str, Any]) -> list[HolidayRule]:
     """
     Parses:
@@ -345,95 +402,113 @@ def _parse_dayname_dict(*, data: dict[str, Any]) -> dict[str, DayName]:
     return out
 
 
-def _parse_bill_dict(*, data: dict[str, Any]) -> dict[str, list[Bill]]:
+def _make_record_parser(
+    ctor: type, n_fields: int
+) -> Callable[..., dict[str, list[Any]]]:
     """
-    """
-    out: dict[str, list[Bill]] = dict()
+    Build a parser for the "day key -> list of field rows" YAML shape.
 
-    if not isinstance(data, dict):
-        raise TypeError(f"Expected dict from YAML loader, got {type(data).__name__}")
-
-    for raw_key, raw_val in data.items():
-        day: str = str(raw_key)
-        day_val: list[Bill] = []
-        for val in raw_val:
-            day_val.append(Bill(day=day, type=val[0], subtype=val[1]))
-
-        out[raw_key] = day_val
-
-    return out
-
-
-def _parse_birthday_dict(*, data: dict[str, Any]) -> dict[str, list[Birthday]]:
-    """
+    The bill/birthday/meeting parsers were copy-paste twins differing
+    only in the constructor tail; each returned record gets the (string)
+    day key first and then the row's leading n_fields values.
     """
-    out: dict[str, list[Birthday]] = dict()
-
-    if not isinstance(data, dict):
-        raise TypeError(f"Expected dict from YAML loader, got {type(data).__name__}")
-
-    for raw_key, raw_val in data.items():
-        day: str = str(raw_key)
-        day_val: list[Birthday] = []
-        for val in raw_val:
-            day_val.append(Birthday(day=day, person=val[0], location=val[1]))
+    def _parse(*, data: dict[str, Any]) -> dict[str, list[Any]]:
+        if not isinstance(data, dict):
+            raise TypeError(
+                f"Expected dict from YAML loader, got {type(data).__name__}"
+            )
+        return {
+            raw_key: [ctor(str(raw_key), *val[:n_fields]) for val in raw_val]
+            for raw_key, raw_val in data.items()
+        }
+
+    return _parse
+
+
+_parse_bill_dict = _make_record_parser(Bill, 2)
+
+_parse_birthday_dict = _make_record_parser(Birthday, 2)
+
+_parse_meeting_dict = _make_record_parser(Meeting, 3)
+
+
+# Display prefix per holiday type, used when rendering a rule's tag.
+_TAG_BY_TYPE: dict[HolidayType, str] = {
+    HolidayType.PUBLIC_HOLIDAY: "PHoliday",
+    HolidayType.PUBLIC_OBSERVANCE: "Observance",
+    HolidayType.HOLIDAY: "Holiday",
+    HolidayType.INSTITUTE: "Institute",
+    HolidayType.CONFERENCE: "Conference",
+    HolidayType.OTHER: "Other",
+}
+
+
+def _rule_dates(rule: HolidayRule, start: date, end: date) -> Iterable[date]:
+    """Yield every date in [start, end] that `rule` applies to."""
+    if rule.kind == "single_annual":
+        m, d = rule.md  # type: ignore[misc]
+        for y in range(start.year, end.year + 1):
+            try:
+                cand = date(y, m, d)
+            except ValueError:
+                continue
+            if start <= cand <= end:
+                yield cand
+
+    elif rule.kind == "single_absolute":
+        if start <= rule.dt <= end:  # type: ignore[operator]
+            yield rule.dt  # type: ignore[misc]
+
+    elif rule.kind == "range_annual":
+        m1, d1 = rule.md_start  # type: ignore[misc]
+        m2, d2 = rule.md_end  # type: ignore[misc]
+        # Start one year early so a Dec->Jan window overlapping `start`
+        # is still expanded.
+        for y in range(start.year - 1, end.year + 1):
+            w_start = date(y, m1, d1)
+            if (m2, d2) >= (m1, d1):
+                w_end = date(y, m2, d2)
+            else:
+                w_end = date(y + 1, m2, d2)
+            lo = max(w_start, start)
+            hi = min(w_end, end)
+            for o in range(lo.toordinal(), hi.toordinal() + 1):
+                yield date.fromordinal(o)
 
-        out[raw_key] = day_val
+    elif rule.kind == "range_absolute":
+        lo = max(rule.start_dt, start)  # type: ignore[type-var]
+        hi = min(rule.end_dt, end)  # type: ignore[type-var]
+        for o in range(lo.toordinal(), hi.toordinal() + 1):
+            yield date.fromordinal(o)
 
-    return out
+    else:
+        raise ValueError(f"Unknown rule kind: {rule.kind}")
 
 
-def _parse_meeting_dict(*, data: dict[str, Any]) -> dict[str, list[Meeting]]:
+def _build_holiday_map(
+    rules: list[HolidayRule], start: date, end: date
+) -> dict[date, str]:
     """
-    """
-    out: dict[str, list[Meeting]] = dict()
-
-    if not isinstance(data, dict):
-        raise TypeError(f"Expected dict from YAML loader, got {type(data).__name__}")
+    Expand all rules over [start, end] into a date -> rendered tag map.
 
-    for raw_key, raw_val in data.items():
-        day: str = str(raw_key)
-        day_val: list[Meeting] = []
-        for val in raw_val:
-            day_val.append(Meeting(
-                day=day,
-                type=val[0],
-                start_time=val[1],
-                end_time=val[2])
-            )
+    The day loop then resolves holidays with one dict lookup instead of an
+    O(rules) scan per day; setdefault preserves the first-rule-wins order
+    of the previous per-day scan.
 
-        out[raw_key] = day_val
-        
-    return out
-
-
-def _holiday_tag_for_date(d: date, rules: list[HolidayRule]) -> str:
-    """All labels that apply to date d (can be multiple)."""
-    value = ""
+    This is the batch formulation of holiday matching: rules expand
+    analytically to the handful of dates they cover, so total work is
+    O(rules + holiday_days) — cheaper than evaluating a days x rules
+    matrix (vectorized or not) and with no numpy involvement.
+    """
+    out: dict[date, str] = {}
     for r in rules:
-        if not r.matches(d):
-            continue
-        if r.type == HolidayType.PUBLIC_HOLIDAY:
-            value = f"[PHoliday - {r.label}]"
-            return value
-        elif r.type == HolidayType.PUBLIC_OBSERVANCE:
-            value = f"[Observance - {r.label}]"
-            return value
-        elif r.type == HolidayType.HOLIDAY:
-            value = f"[Holiday - {r.label}]"
-            return value
-        elif r.type == HolidayType.INSTITUTE:
-            value = f"[Institute - {r.label}]"
-            return value
-        elif r.type == HolidayType.CONFERENCE:
-            value = f"[Conference - {r.label}]"
-            return value
-        elif r.type == HolidayType.OTHER:
-            value = f"[Other - {r.label}]"
-            return value
-    return value
+        tag = f"[{_TAG_BY_TYPE[r.type]} - {r.label}]"
+        for d in _rule_dates(r, start, end):
+            out.setdefault(d, tag)
+    return out
 
 
+@functools.lru_cache(maxsize=1024)
 def _parse_date(s: str) -> date:
     """
     Parse a date string into a datetime.date.
@@ -442,7 +517,22 @@ def _parse_date(s: str) -> date:
     - YYYY-MM-DD
     - DD.MM.YYYY
     - DD/MM/YYYY
+
+    Well-formed inputs are dispatched on their separator shape and built
+    straight from int slices — no strptime format parsing; anything odd
+    falls back to the strptime loop. Results are memoized.
     """
+    if len(s) == 10:
+        try:
+            if s[4] == "-" and s[7] == "-":
+                return date(int(s[:4]), int(s[5:7]), int(s[8:]))
+            if s[2] == "." and s[5] == ".":
+                return date(int(s[6:]), int(s[3:5]), int(s[:2]))
+            if s[2] == "/" and s[5] == "/":
+                return date(int(s[6:]), int(s[3:5]), int(s[:2]))
+        except ValueError:
+            pass
+
     formats: tuple[str, str, str] = (
         "%Y-%m-%d",
         "%d.%m.%Y",
@@ -461,15 +551,18 @@ def _parse_date(s: str) -> date:
     )
 
 
-def _get_date(cur_day: date):
-
-    day_nb = cur_day.strftime('%d')  # Day with leading zero (01–31)
-    month_nb = cur_day.strftime("%m")  # Month with leading zero (01–12)
-    month_name = cur_day.strftime("%B") # Month name
-    year_nb = cur_day.strftime("%Y") # Year with leading zero (0001–9999)
-    cur_day_week = cur_day.strftime("%A") # Day of the week (str)
+def _get_date(cur_day: date) -> tuple[str, str, str, str, str]:
 
-    return day_nb, month_nb, month_name, year_nb, cur_day_week
+    # Plain integer formatting plus the module name tables: no strftime
+    # (C locale machinery) per day. Fields are, in order: day (01-31),
+    # month (01-12), month name, year (0001-9999), weekday name.
+    return (
+        f"{cur_day.day:02d}",
+        f"{cur_day.month:02d}",
+        _MONTH_NAMES[cur_day.month],
+        f"{cur_day.year:04d}",
+        _WEEKDAY_NAMES[cur_day.weekday()],
+    )
 
 
 def _calculate_separation(
@@ -478,11 +571,10 @@ def _calculate_separation(
     right_length: int,
 ) -> tuple[int, int]:
 
-    splen = total_length - (left_length + right_length)
-    if splen % 2 == 0:
-        half_splen = int(splen/2)
-        return half_splen-1, half_splen
-    half_splen = int(floor(float(splen/2)))
+    # One divmod instead of a modulo test plus float divisions.
+    half_splen, rem = divmod(total_length - (left_length + right_length), 2)
+    if rem == 0:
+        return half_splen - 1, half_splen
     return half_splen, half_splen
 
 
@@ -530,152 +622,200 @@ def todo_generator(
     """
 
     # RULES
-    holiday_yaml_dict: dict[str, Any] = _load_yaml_dict(yaml_path=holiday_yaml_path)
+    holiday_yaml_dict: dict[str, Any] = _load_yaml(yaml_path=holiday_yaml_path)
     holiday_rule_list: list[HolidayRule] = _parse_holiday_rules(data=holiday_yaml_dict)
     
     # day_map_dict
-    daymap_yaml_dict: dict[str, Any] = _load_yaml_dict(yaml_path=daymap_yaml_path)
+    daymap_yaml_dict: dict[str, Any] = _load_yaml(yaml_path=daymap_yaml_path)
     daymap_dict: dict[str, DayName] = _parse_dayname_dict(
         data=daymap_yaml_dict
     )
 
     # meeting_dict, appointment_dict
-    meetings_yaml_dict: dict[str, Any] = _load_yaml_dict(yaml_path=meetings_yaml_path)
+    meetings_yaml_dict: dict[str, Any] = _load_yaml(yaml_path=meetings_yaml_path)
     meetings_dict: dict[str, list[Meeting]] = _parse_meeting_dict(
         data=meetings_yaml_dict
     )
 
     # bills_dict
-    bills_yaml_dict: dict[str, Any] = _load_yaml_dict(yaml_path=bills_yaml_path)
+    bills_yaml_dict: dict[str, Any] = _load_yaml(yaml_path=bills_yaml_path)
     bills_dict: dict[str, list[Bill]] = _parse_bill_dict(
         data=bills_yaml_dict
     )
 
     # birthdate_dict
-    bdays_yaml_dict: dict[str, Any] = _load_yaml_dict(yaml_path=bdays_yaml_path)
+    bdays_yaml_dict: dict[str, Any] = _load_yaml(yaml_path=bdays_yaml_path)
     bdays_dict: dict[str, list[Birthday]] = _parse_birthday_dict(
         data=bdays_yaml_dict
     )
 
-    todo_placeholder: str = "\n".join(
-        ["[ ] <Main : Topic> Placeholder {03:00}"] * 4
-    )
+    # Re-key the calendar lookups to ints: the day loop then hashes a
+    # (month, day) tuple / a plain int instead of building a fresh
+    # "DD.MM" (or "DD") string per iteration just to probe the dict.
+    bdays_by_md: dict[tuple[int, int], list[Birthday]] = {}
+    for key, val in bdays_dict.items():
+        dd, mm = key.split(".")
+        bdays_by_md[(int(mm), int(dd))] = val
+    bills_by_day: dict[int, list[Bill]] = {
+        int(key): val for key, val in bills_dict.items()
+    }
 
     header_line: str = "=" * BIG_RULER_LENGTH
     big_ruler_line: str = "-" * BIG_RULER_LENGTH
     small_ruler_line: str = "-" * SMALL_RULER_LENGTH
 
-    with open(output_path, "w") as f:
-
-        start_date: date = _parse_date(start_date_str)
-        end_date: date = _parse_date(end_date_str)
-        if end_date < start_date:
-            raise ValueError("End week must be the same as or after start week.")
-
-        current_day: date = start_date
-        while current_day <= end_date:
-
-            # Get all day attributes
-            (
-                current_day_number,
-                current_month_number,
-                current_month_name,
-                current_year_number,
-                current_day_week,
-             ) = _get_date(current_day)
-
-            # Map name of Week Day
-            current_day_week_name: DayName = daymap_dict.get(
-                current_day_week,
-                DayName(),
-            )
-
-            # Check Sunday Status
-            is_sunday: bool = current_day_week_name.name_en == "Sunday"
-
-            # Get meetings
-            meetings_list: list[Meeting] = meetings_dict.get(
-                f"{current_day_week_name.name_en}",
-                [],
-            )
+    # The day skeleton is a fixed template; compose its constant runs
+    # once here so each iteration emits a few prebuilt fragments rather
+    # than re-appending every ruler and newline separately.
+    day_head: str = "\n" + header_line + "\n"
+    big_ruler_nl: str = big_ruler_line + "\n"
+    small_ruler_nl: str = small_ruler_line + "\n"
+    todo_block: str = (
+        big_ruler_line + "\n" + _TODO_PLACEHOLDER + "\n" + big_ruler_line
+    )
 
-            # Get birthdays
-            bdays_list: list[Birthday] = bdays_dict.get(
-                f"{current_day_number}.{current_month_number}",
-                [],
-            )
+    # Weekday-keyed lookups resolve to only seven distinct values; compute
+    # them once, indexed by date.weekday(), instead of hashing dict keys
+    # (and building default objects) on every iteration.
+    day_names_by_wd: list[DayName] = [
+        daymap_dict.get(n, _EMPTY_DAYNAME) for n in _WEEKDAY_NAMES
+    ]
+    meetings_by_wd: list[list[Meeting]] = [
+        meetings_dict.get(dn.name_en, []) for dn in day_names_by_wd
+    ]
+    is_sunday_by_wd: list[bool] = [dn.name_en == "Sunday" for dn in day_names_by_wd]
+    # The "Name_en | Name_pt" half of the date line only has seven
+    # possible values; join them here so the day loop never re-joins
+    # (or re-tuples) the DayName fields.
+    names_joined_by_wd: list[str] = [
+        " | ".join([dn.name_en, dn.name_pt]) for dn in day_names_by_wd
+    ]
+
+    start_date: date = _parse_date(start_date_str)
+    end_date: date = _parse_date(end_date_str)
+    if end_date < start_date:
+        raise ValueError("End week must be the same as or after start week.")
+
+    # One O(1) lookup per day instead of scanning every rule per day.
+    holiday_map: dict[date, str] = _build_holiday_map(
+        holiday_rule_list, start_date, end_date
+    )
 
-            # Get bills
-            bills_list: list[Bill] = bills_dict.get(f"{current_day_number}", [])
+    # The whole document is at most a few MB, so build it entirely in
+    # memory and hand the kernel a single write at the end.
+    out_parts: list[str] = []
+
+    # Iterate the proleptic-Gregorian ordinals directly: one int per
+    # day instead of a date + timedelta allocation per step, and the
+    # weekday falls out of the offset arithmetic for free.
+    start_ord: int = start_date.toordinal()
+    start_wd: int = start_date.weekday()
+
+    # Locals beat globals in the day loop (LOAD_FAST vs LOAD_GLOBAL);
+    # bind the helpers touched every iteration once here. The bound
+    # .get methods additionally skip a LOAD_ATTR per probe.
+    from_ordinal = date.fromordinal
+    get_date = _get_date
+    calc_separation = _calculate_separation
+    week_sep_block = _WEEK_SEP_BLOCK
+    bdays_get = bdays_by_md.get
+    bills_get = bills_by_day.get
+    holiday_get = holiday_map.get
+
+    for ordv in range(start_ord, end_date.toordinal() + 1):
+        current_day: date = from_ordinal(ordv)
+
+        # Get all day attributes
+        (
+            current_day_number,
+            current_month_number,
+            current_month_name,
+            current_year_number,
+            current_day_week,
+         ) = get_date(current_day)
+
+        # Map name of Week Day (precomputed per weekday index)
+        wd: int = (start_wd + ordv - start_ord) % 7
+
+        # Check Sunday Status
+        is_sunday: bool = is_sunday_by_wd[wd]
+
+        # Get meetings
+        meetings_list: list[Meeting] = meetings_by_wd[wd]
+
+        # Get birthdays
+        bdays_list: Iterable[Birthday] = bdays_get(
+            (current_day.month, current_day.day),
+            _EMPTY,
+        )
 
-            # Get Holiday Tag
-            holiday_tag: str = _holiday_tag_for_date(
-                current_day,
-                holiday_rule_list
-            )
+        # Get bills
+        bills_list: Iterable[Bill] = bills_get(current_day.day, _EMPTY)
 
-            date_line_start: str = (
-                f"{"-".join([
-                    current_year_number,
-                    current_month_number,
-                    current_day_number
-                ])} | "
-                f"{" | ".join(list(astuple(current_day_week_name)))}"
-            )
+        # Get Holiday Tag
+        holiday_tag: str = holiday_get(current_day, "")
 
-            date_line_end: str = (
-                f"{" | ".join(
-                    [holiday_tag, current_month_name, current_day_number]
-                )}"
-            )
+        date_line_start: str = (
+            f"{current_year_number}-{current_month_number}-{current_day_number} | "
+            + names_joined_by_wd[wd]
+        )
 
-            splen: tuple[int, int] = _calculate_separation(
-                    BIG_RULER_LENGTH,
-                    len(date_line_start),
-                    len(date_line_end),
-            )
+        date_line_end: str = (
+            f"{" | ".join(
+                [holiday_tag, current_month_name, current_day_number]
+            )}"
+        )
 
-            date_line_sp: str = f"{" " * splen[0]}•{" " * splen[1]}"
+        splen: tuple[int, int] = calc_separation(
+                BIG_RULER_LENGTH,
+                len(date_line_start),
+                len(date_line_end),
+        )
 
-            week_sep_line: str = ""
-            if is_sunday:
-                week_sep_line: str = f"\n\n{"#" * WEEK_RULER_LENGTH}\n"
+        date_line_sp: str = f"{" " * splen[0]}•{" " * splen[1]}"
+
+        week_sep_line: str = week_sep_block if is_sunday else ""
+
+        format_meeting_list: list[str] = [
+            f"> [ ] Meeting | {meet.type} | {meet.start_time} - {meet.end_time}"
+            for meet in meetings_list
+        ]
+        format_bills_list: list[str] = [
+            f"> [ ] Bill | {bill.type} | {bill.subtype}" for bill in bills_list
+        ]
+        format_bdays_list: list[str] = [
+            f"> [ ] Birthday | {bday.person} | {bday.location}"
+            for bday in bdays_list
+        ]
+
+        # Emit the day as a flat list of fragments: no nested f-string
+        # re-formatting and no intermediate big_str allocation. Each
+        # non-empty section joins and terminates itself here, and the
+        # fixed skeleton pieces (day_head, rulers, todo_block) were
+        # composed once before the loop.
+        parts: list[str] = [
+            day_head,
+            date_line_start, date_line_sp, date_line_end, "\n",
+            big_ruler_nl,
+        ]
+        if format_meeting_list:
+            parts.append("\n".join(format_meeting_list))
+            parts.append("\n")
+        parts.append(small_ruler_nl)
+        if format_bills_list:
+            parts.append("\n".join(format_bills_list))
+            parts.append("\n")
+        if format_bdays_list:
+            parts.append("\n".join(format_bdays_list))
+            parts.append("\n")
+        parts.append(todo_block)
+        if week_sep_line:
+            parts.append(week_sep_line)
+        parts.append("\n")
+        out_parts.extend(parts)
 
-            format_meeting_list: list[str] = []
-            format_bills_list: list[str] = []
-            format_bdays_list: list[str] = []
-            if meetings_list:
-                for meet in meetings_list:
-                    mstr = (
-                        f"> [ ] Meeting | {meet.type} | "
-                        f"{meet.start_time} - {meet.end_time}"
-                    )
-                    format_meeting_list.append(mstr)
-            if bills_list:
-                for bill in bills_list:
-                    mstr = f"> [ ] Bill | {bill.type} | {bill.subtype}"
-                    format_bills_list.append(mstr)
-            if bdays_list:
-                for bday in bdays_list:
-                    mstr = f"> [ ] Birthday | {bday.person} | {bday.location}"
-                    format_bdays_list.append(mstr)
-
-            # Putting a newline symbol at the end of each major format list
-            for flist in [format_meeting_list, format_bills_list, format_bdays_list]:
-                if flist:
-                    flist[-1] += "\n"
-
-            big_str = f"""
-{header_line}
-{date_line_start}{date_line_sp}{date_line_end}
-{big_ruler_line}
-{"\n".join(format_meeting_list)}{small_ruler_line}
-{"\n".join(format_bills_list)}{"\n".join(format_bdays_list)}{big_ruler_line}
-{todo_placeholder}
-{big_ruler_line}{week_sep_line}
-"""
-            f.write(big_str)
-            current_day += timedelta(days=1)
+    with open(output_path, "w") as f:
+        f.write("".join(out_parts))
 
 
 # --------------------------------------------------------------------------------------
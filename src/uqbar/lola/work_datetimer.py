@@ -17,38 +17,53 @@ Metadata
 # --------------------------------------------------------------------------------------
 # Imports
 # --------------------------------------------------------------------------------------
-import locale
 import random
+import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-random.seed(1987)
+# Portuguese weekday names indexed by date.weekday(). A fixed table
+# instead of setlocale + strftime('%A'): no process-global locale
+# mutation, no dependency on pt_BR.UTF-8 being installed, and the
+# lookup is a constant-time index.
+_PT_WEEKDAYS = (
+    "Segunda-feira", "Terça-feira", "Quarta-feira", "Quinta-feira",
+    "Sexta-feira", "Sábado", "Domingo",
+)
 
 def generate_weekdays(start_date: str, end_date: str):
-    # Set locale to Portuguese
-    locale.setlocale(locale.LC_TIME, 'pt_BR.UTF-8')
-    
     # Convert string dates to datetime objects
     start = datetime.strptime(start_date, "%d.%m.%Y")
     end = datetime.strptime(end_date, "%d.%m.%Y")
     space_dict ={x:y for x,y in enumerate([3, 5, 4, 4, 5])}
 
-    # Iterate over days and print only weekdays (Monday to Friday)
+    # Own generator instance, seeded per call: reproducible without
+    # touching the module-global random state, and the bound randint
+    # skips the module attribute walk per draw.
+    rng = random.Random(1987)
+    ri = rng.randint
+
+    # Iterate over days and collect only weekdays (Monday to Friday)
+    lines: list[str] = []
     current = start
     previous_week = None
     while current <= end:
         if current.weekday() < 5:  # Monday to Friday
             week_number = current.strftime("%U")  # Get the week number
             if previous_week and week_number != previous_week:
-                print("")  # Separate different weeks
+                lines.append("")  # Separate different weeks
             spaces = " " * space_dict[current.weekday()]
-            unique_time_1 = ":".join([f"{random.randint(9, 11):02}", f"{random.randint(0, 59):02}"])
-            unique_time_2 = ":".join([f"{random.randint(19, 21):02}", f"{random.randint(0, 59):02}"])
+            unique_time_1 = ":".join([f"{ri(9, 11):02}", f"{ri(0, 59):02}"])
+            unique_time_2 = ":".join([f"{ri(19, 21):02}", f"{ri(0, 59):02}"])
             unique_time = "-".join([unique_time_1, unique_time_2])
-            print(f"{current.strftime('%A').split(" ")[0]} ({current.strftime('%d.%m.%Y')}):" + spaces + unique_time)
+            lines.append(f"{_PT_WEEKDAYS[current.weekday()]} ({current.strftime('%d.%m.%Y')}):" + spaces + unique_time)
             previous_week = week_number
         current += timedelta(days=1)
 
+    # One write instead of one print (write + flush) per line.
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 def generate_monday_day(start_date: str, end_date: str, output_path: Path):
     """
     Write all Mondays between start_date and end_date to output_path.
@@ -57,41 +72,35 @@ def generate_monday_day(start_date: str, end_date: str, output_path: Path):
     Blank line between months, and '---' between years.
     """
 
-    # Set locale to Portuguese (Brazil)
-    try:
-        locale.setlocale(locale.LC_TIME, 'pt_BR.UTF-8')
-    except locale.Error:
-        print("Aviso: locale pt_BR.UTF-8 não disponível; usando padrão do sistema.")
+    # Convert strings to dates
+    start = datetime.strptime(start_date, "%d.%m.%Y").date()
+    end = datetime.strptime(end_date, "%d.%m.%Y").date()
 
-    # Convert strings to datetime
-    start = datetime.strptime(start_date, "%d.%m.%Y")
-    end = datetime.strptime(end_date, "%d.%m.%Y")
+    # Jump straight to the first Monday on or after start_date, then
+    # step whole weeks over ordinals: no day-by-day probing walk.
+    first_monday = start + timedelta(days=(7 - start.weekday()) % 7)
+
+    current_year = first_monday.year
+    current_month = first_monday.month
+
+    lines: list[str] = []
+    for ordv in range(first_monday.toordinal(), end.toordinal() + 1, 7):
+        monday = date.fromordinal(ordv)
+        year, month, day = monday.year, monday.month, monday.day
 
-    # Move to the first Monday on or after start_date
-    while start.weekday() != 0:
-        start += timedelta(days=1)
+        # Header for month/year if starting or new month
+        if year != current_year:
+            lines.append("\n---\n\n")
+            current_year = year
+        if month != current_month:
+            lines.append("\n")
+            current_month = month
 
-    current_year = start.year
-    current_month = start.month
+        lines.append(f"{month:02d}/{year}: {day:02d}\n")
 
+    # One write for the whole listing instead of one per Monday.
     with open(output_path, "w", encoding="utf-8") as f:
-        date = start
-        while date <= end:
-            year, month, day = date.year, date.month, date.day
-
-            # Write header for month/year if starting or new month
-            if year != current_year:
-                f.write("\n---\n\n")
-                current_year = year
-            if month != current_month:
-                f.write("\n")
-                current_month = month
-
-            # Write formatted line
-            f.write(f"{month:02d}/{year}: {day:02d}\n")
-
-            # Next Monday
-            date += timedelta(days=7)
+        f.write("".join(lines))
 
 if __name__ == "__main__":
 
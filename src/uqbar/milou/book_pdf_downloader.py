@@ -12,17 +12,13 @@ micromamba install -c conda-forge yt-dlp
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
 from time import sleep
 from typing import Any
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+import requests
 
 from uqbar.utils.stats import get_random
 from uqbar.utils.web import download_url_to_path
@@ -36,6 +32,22 @@ SLEEP_BASE: float = 0.1
 
 NAV_SIZE_WINDOW: tuple[int, int] = (1920, 1080)
 
+REQUEST_TIMEOUT_S: float = 20.0
+
+# Result pages that render server-side answer a plain GET; the browser
+# fallback below only runs when this path finds nothing.
+_REQUEST_HEADERS: dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+}
+
+# Concurrent fetches across search URLs; the work is network-bound.
+_FETCH_MAX_WORKERS: int = 8
+
 
 # -------------------------------------------------------------------------------------
 # Helpers
@@ -49,25 +61,108 @@ def _resolve_iterable(obj: Any) -> tuple[bool | None, Any | None]:
     else:
         return False, obj
 
-# --------------------------------------------------------------------------------------
-# Functions
-# --------------------------------------------------------------------------------------
-def search_for_links(
+
+class _ResultLinkParser(HTMLParser):
+    """
+    Collects hrefs from result-entry title anchors.
+
+    The browser path walked .../ol/li/article/div[3]/h2/a; structurally
+    that is "an <a> inside an <h2> inside an <article>", which is what
+    this parser tracks — it tolerates the div-index churn that made the
+    absolute XPath brittle.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._article_depth: int = 0
+        self._h2_depth: int = 0
+        self.links: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "article":
+            self._article_depth += 1
+        elif tag == "h2" and self._article_depth:
+            self._h2_depth += 1
+        elif tag == "a" and self._h2_depth:
+            for name, value in attrs:
+                if name == "href" and value:
+                    self.links.append(value)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "article" and self._article_depth:
+            self._article_depth -= 1
+        elif tag == "h2" and self._h2_depth:
+            self._h2_depth -= 1
+
+
+def _extract_result_links(html_text: str) -> list[str]:
+    """Parse a result page and return the entry-title hrefs, in order."""
+    parser = _ResultLinkParser()
+    parser.feed(html_text)
+    return parser.links
+
+
+def _fetch_links(
+    search_url: str,
+    query_format_list: list[str],
+    timeout_s: float,
+) -> list[str]:
+    """
+    One plain-GET attempt at a search URL; returns the format-filtered
+    links, or [] when the page errors out or yields nothing (the caller
+    then decides whether to fall back to a browser).
+    """
+    try:
+        r = requests.get(
+            search_url,
+            headers=_REQUEST_HEADERS,
+            timeout=timeout_s,
+            allow_redirects=True,
+        )
+    except requests.RequestException:
+        return []
+
+    if not (200 <= r.status_code < 400):
+        return []
+
+    return [
+        web_link
+        for web_link in _extract_result_links(r.text)
+        if web_link.split(".")[-1] in query_format_list
+    ]
+
+
+def _search_with_browser(
     link_list: list[str],
     query_format_list: list[str],
     *,
-    options: Options = Options(),
-    service: Service = Service(ChromeDriverManager().install()),
+    options: Any | None = None,
+    service: Any | None = None,
     nav_window_size: tuple[int, int] = NAV_SIZE_WINDOW,
     waiter_total_time_base: float = WAITER_TOTAL_TIME_BASE,
     sleep_base: float = SLEEP_BASE,
-) -> list[str] | None:
+) -> list[str]:
     """
-    Placeholder
+    Browser fallback for JS-rendered result pages.
+
+    Selenium (and the chromedriver download) is imported lazily so the
+    HTTP-first path never pays for it — previously the driver install
+    ran at import time as a default-argument expression.
     """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    if options is None:
+        options = Options()
+    if service is None:
+        service = Service(ChromeDriverManager().install())
 
     # Driver Main
-    driver: webdriver = webdriver.Chrome(service=service, options=options)
+    driver = webdriver.Chrome(service=service, options=options)
 
     # Create window to maximize chance
     driver.maximize_window()
@@ -88,98 +183,46 @@ def search_for_links(
         # Find all <html> elements
         web_element_list = driver.find_element(By.XPATH, "/html")
 
-        # Find all /html/body/div[2] elements
-        max_tries: int = 0
-        curr_element_list: list[WebElement] | WebElement = []
-
-        while not curr_element_list or max_tries < 3:
-            try:
-                wait = WebDriverWait(web_element_list, timeout=waiter_total_time_base)
-                web_element_list = wait.until(
-                    lambda p: p.find_element(
-                        By.XPATH,
-                        "//*/body/div[2]"
-                    )
-                )
-                sleep(sleep_base + get_random())
-                is_it, curr_element_list = _resolve_iterable(web_element_list)
-            except Exception:
-                pass
-            finally:
-                max_tries += 1
-
-        # Find all /html/body/div[2]/div[6]/div[4] elements
-        max_tries: int = 0
-        curr_element_list: list[WebElement] | WebElement = []
-        while not curr_element_list or max_tries < 3:
-            try:
-                wait = WebDriverWait(web_element_list, timeout=waiter_total_time_base)
-                web_element_list = wait.until(
-                    lambda p: p.find_element(
-                        By.XPATH,
-                        "//*/div[6]/div[4]"
-                    )
-                )
-                sleep(sleep_base + get_random())
-                is_it, curr_element_list = _resolve_iterable(web_element_list)
-            except Exception:
-                pass
-            finally:
-                max_tries += 1
-
-        # Find all /html/body/div[2]/div[6]/div[4]/div/div/div elements
-        max_tries: int = 0
-        curr_element_list: list[WebElement] | WebElement = []
-        while not curr_element_list or max_tries < 3:
-            try:
-                wait = WebDriverWait(web_element_list, timeout=waiter_total_time_base)
-                web_element_list = wait.until(
-                    lambda p: p.find_element(
-                        By.XPATH,
-                        "//*/div/div/div"
+        # Walk down to the result list step by step, retrying each hop
+        for step_xpath in (
+            "//*/body/div[2]",
+            "//*/div[6]/div[4]",
+            "//*/div/div/div",
+            "//*/div[2]/section[1]/ol",
+        ):
+            max_tries: int = 0
+            curr_element_list: Any = []
+            while not curr_element_list or max_tries < 3:
+                try:
+                    wait = WebDriverWait(
+                        web_element_list, timeout=waiter_total_time_base
                     )
-                )
-                sleep(sleep_base + get_random())
-                is_it, curr_element_list = _resolve_iterable(web_element_list)
-            except Exception:
-                pass
-            finally:
-                max_tries += 1
-
-        # Find all /html/body/div[2]/div[6]/div[4]/div/div/div/div[2]/section[1]/ol
-        # elements
-        max_tries: int = 0
-        curr_element_list: list[WebElement] | WebElement = []
-        while not curr_element_list or max_tries < 3:
-            try:
-                wait = WebDriverWait(web_element_list, timeout=waiter_total_time_base)
-                web_element_list = wait.until(
-                    lambda p: p.find_element(
-                        By.XPATH,
-                        "//*/div[2]/section[1]/ol"
+                    web_element_list = wait.until(
+                        lambda p, xp=step_xpath: p.find_element(By.XPATH, xp)
                     )
-                )
-                sleep(sleep_base + get_random())
-                is_it, curr_element_list = _resolve_iterable(web_element_list)
-            except Exception:
-                pass
-            finally:
-                max_tries += 1
+                    sleep(sleep_base + get_random())
+                    is_it, curr_element_list = _resolve_iterable(web_element_list)
+                except Exception:
+                    pass
+                finally:
+                    max_tries += 1
 
         # Iterate on 10 (first page) li items
         for idx in range(10):
 
-            max_tries: int = 0
-            wel_list: list[WebElement] | WebElement = []
+            max_tries = 0
+            wel_list: Any = []
             while not wel_list or max_tries < 3:
                 try:
 
-                    wait = WebDriverWait(web_element_list, timeout=waiter_total_time_base)
+                    wait = WebDriverWait(
+                        web_element_list, timeout=waiter_total_time_base
+                    )
 
                     wel_list = wait.until(
-                    lambda p: p.find_element(
-                        By.XPATH,
-                        f"//*/li[{idx}]/article/div[3]/h2/a"
+                        lambda p: p.find_element(
+                            By.XPATH,
+                            f"//*/li[{idx}]/article/div[3]/h2/a"
                         )
                     )
                     sleep(sleep_base + get_random())
@@ -224,6 +267,62 @@ def search_for_links(
     return ebook_link_list
 
 
+# --------------------------------------------------------------------------------------
+# Functions
+# --------------------------------------------------------------------------------------
+def search_for_links(
+    link_list: list[str],
+    query_format_list: list[str],
+    *,
+    options: Any | None = None,
+    service: Any | None = None,
+    nav_window_size: tuple[int, int] = NAV_SIZE_WINDOW,
+    waiter_total_time_base: float = WAITER_TOTAL_TIME_BASE,
+    sleep_base: float = SLEEP_BASE,
+    timeout_s: float = REQUEST_TIMEOUT_S,
+) -> list[str] | None:
+    """
+    Collect result links for every search URL, HTTP-first.
+
+    Each URL is fetched concurrently with a plain GET and parsed for
+    entry-title anchors; only URLs that yield nothing that way fall back
+    to the Selenium walk (JS-rendered pages), which costs a browser
+    start plus several seconds of fixed sleeps per URL. `options` and
+    `service` are passed through to the fallback driver when given.
+    """
+    ebook_link_list: list[str] = []
+    pending: list[str] = []
+
+    if link_list:
+        with ThreadPoolExecutor(
+            max_workers=min(_FETCH_MAX_WORKERS, len(link_list))
+        ) as pool:
+            fetched = pool.map(
+                lambda u: _fetch_links(u, query_format_list, timeout_s),
+                link_list,
+            )
+            for search_url, links in zip(link_list, fetched, strict=True):
+                if links:
+                    ebook_link_list.extend(links)
+                else:
+                    pending.append(search_url)
+
+    if pending:
+        ebook_link_list.extend(
+            _search_with_browser(
+                pending,
+                query_format_list,
+                options=options,
+                service=service,
+                nav_window_size=nav_window_size,
+                waiter_total_time_base=waiter_total_time_base,
+                sleep_base=sleep_base,
+            )
+        )
+
+    return ebook_link_list
+
+
 def download_write(
     query_link_list: list[str],
     output_path: Path,
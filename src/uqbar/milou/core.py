@@ -30,7 +30,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
 
 from uqbar.milou.book_pdf_downloader import download_write, search_for_links
 from uqbar.milou.book_processor import (
@@ -111,7 +114,7 @@ def milou_core(
     if Semaphore.ZERO:
         command_subtipe: str = args[Args.COMMAND_SUBTIPE]
         input_path: Path = args[Args.INPUT_PATH]
-        output_path: Path = args[Args.OUTPUT_PATH]
+        output_path: Path = args[Args.OUTPUT_PATH] or Path.cwd()
         query: str = args[Args.QUERY]
         search_engines: str = args[Args.SEARCH_ENGINES]
         formats_allowed: str = args[Args.FORMATS_ALLOWED]
@@ -27,7 +27,10 @@ Metadata
 # -------------------------------------------------------------------------------------
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
 
 # -------------------------------------------------------------------------------------
 # Constants
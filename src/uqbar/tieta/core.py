@@ -32,7 +32,10 @@ from argparse import ArgumentError
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
 
 from uqbar.tieta.claude_prompt_parser import create_prompts
 from uqbar.tieta.gpt_prompt_parser import create_multiprompt_list
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: MIT
+"""Regression tests for the faust matching pipeline."""
+
+import re
+
+from uqbar.faust.matching import Matcher, _fuse_patterns
+
+
+def test_fusion_bails_on_capturing_groups() -> None:
+    # Fusing renumbers capturing groups, so a numbered backreference would
+    # silently rebind to another query's wrapper group; such pattern sets
+    # must skip fusion entirely.
+    patterns = (re.compile("(a)x"), re.compile(r"(b)\1"))
+    assert _fuse_patterns(patterns) is None
+
+
+def test_backreference_query_matches_via_fallback() -> None:
+    raw_queries = ["/(a)x/", r"/(b)\1/"]
+    patterns = [re.compile("(a)x"), re.compile(r"(b)\1")]
+    matcher = Matcher.from_queries(raw_queries, patterns)
+
+    assert matcher.fused is None
+    assert matcher.match("ax") == raw_queries[0]
+    assert matcher.match("bb") == raw_queries[1]
+    assert matcher.match("ba") is None
+
+
+def test_group_free_queries_still_fuse() -> None:
+    raw_queries = ["/ax/", "/b+/"]
+    patterns = [re.compile("ax"), re.compile("b+")]
+    matcher = Matcher.from_queries(raw_queries, patterns)
+
+    assert matcher.fused is not None
+    assert matcher.match("ax") == raw_queries[0]
+    assert matcher.match("bbb") == raw_queries[1]
+    assert matcher.match("zz") is None